@@ -0,0 +1,8 @@
+from django.db import models
+
+
+class CartSyncMode(models.TextChoices):
+    """Choices for CartSyncMode."""
+
+    REPLACE = "replace", "Əvəz et"
+    MERGE = "merge", "Birləşdir"
@@ -0,0 +1,50 @@
+from decimal import Decimal
+
+from django.db.models import BooleanField, Case, DecimalField, F, IntegerField, QuerySet, Value, When
+from django.db.models.functions import Round
+from django.utils import timezone
+
+
+class CartQuerySet(QuerySet):
+    """Custom queryset for Cart model."""
+
+    def with_prices(self, code_discount: int = 0):
+        """
+        Annotate discount, unit price after the discount, subtotal and total of the cart items with SQL expressions.
+
+        Follows the checkout rules: products without their own active discount which take part in promotions
+        get the discount of the personal or promo code. Prices are rounded to cents per unit.
+        """
+        today = timezone.localtime(timezone.now()).date()
+        money = DecimalField(max_digits=10, decimal_places=2)
+
+        return (
+            self.annotate(
+                product_discount=Case(
+                    When(product__discount_end_date__lt=today, then=Value(0)),
+                    default=F("product__discount"),
+                    output_field=IntegerField(),
+                ),
+            )
+            .annotate(
+                is_promo_applied=Case(
+                    When(product__is_promo=True, product_discount=0, then=Value(code_discount > 0)),
+                    default=Value(False),
+                    output_field=BooleanField(),
+                ),
+            )
+            .annotate(
+                discount=Case(
+                    When(is_promo_applied=True, then=Value(code_discount)),
+                    default=F("product_discount"),
+                    output_field=IntegerField(),
+                ),
+            )
+            .annotate(
+                final_price=Round(
+                    F("product__price") * (100 - F("discount")) * Value(Decimal("0.01")), 2, output_field=money
+                ),
+                subtotal=Round(F("product__price") * F("quantity"), 2, output_field=money),
+            )
+            .annotate(total=Round(F("final_price") * F("quantity"), 2, output_field=money))
+        )
@@ -1,6 +1,12 @@
+from collections import defaultdict
+
+from django.db import transaction
 from rest_framework import serializers
 
+from server.apps.account.logic.constants import CartSyncMode
+from server.apps.account.logic.utils import invalidate_favorite_ids
 from server.apps.account.models import Cart, Favorite
+from server.apps.order.logic.utils import get_stock_errors
 from server.apps.product.logic.serializers import ProductSerializer
 from server.apps.product.models import Product
 from server.apps.user.models import User
@@ -84,13 +90,57 @@ class FavoriteSerializer(serializers.ModelSerializer):
         user = self.context["request"].user
         product = validated_data["product"]
 
-        favorite = Favorite.objects.get_or_create(user=user, product=product)[0]
+        favorite, created = Favorite.objects.get_or_create(user=user, product=product)
+
+        if created:
+            invalidate_favorite_ids(user.pk)
 
         return favorite
 
     def to_representation(self, instance: Favorite):
-        """Return the product of the favorite item."""
-        return ProductSerializer(instance.product, context=self.context).data
+        """Return the product of the favorite item, which is favorited by definition."""
+        return ProductSerializer(instance.product, context={**self.context, "is_favorite": True}).data
+
+
+class FavoriteBulkSerializer(serializers.Serializer):
+    """
+    Serializer for adding and removing favorite products in bulk.
+
+    Products are resolved with a single query and unknown slugs are skipped, e.g. products deleted
+    since the favorites were saved on the device.
+    """
+
+    add = serializers.ListField(child=serializers.SlugField(), required=False, default=list, max_length=1000)
+    remove = serializers.ListField(child=serializers.SlugField(), required=False, default=list, max_length=1000)
+
+    def validate(self, data: dict):
+        """Validate if no product is both added and removed."""
+        if set(data["add"]) & set(data["remove"]):
+            raise serializers.ValidationError("Məhsul eyni zamanda həm əlavə, həm də silinə bilməz")
+
+        return data
+
+    def create(self, validated_data: dict):
+        """Add and remove the favorite products of the authenticated user."""
+        user = self.context["request"].user
+        add = set(validated_data["add"])
+
+        products = Product.objects.filter(slug__in=add | set(validated_data["remove"])).values_list("id", "slug")
+
+        added = [product_id for product_id, slug in products if slug in add]
+        removed = [product_id for product_id, slug in products if slug not in add]
+
+        with transaction.atomic():
+            Favorite.objects.bulk_create(
+                [Favorite(user=user, product_id=product_id) for product_id in added], ignore_conflicts=True
+            )
+
+            if removed:
+                user.favorites.filter(product__in=removed).delete()
+
+        invalidate_favorite_ids(user.pk)
+
+        return user
 
 
 class CartSerializer(serializers.ModelSerializer):
@@ -131,6 +181,102 @@ class CartSerializer(serializers.ModelSerializer):
         }
 
 
+class CartItemSerializer(serializers.Serializer):
+    """Serializer for an item of the cart sync."""
+
+    product = serializers.SlugField()
+    quantity = serializers.IntegerField(min_value=0, max_value=1000)
+
+
+class CartSyncSerializer(serializers.Serializer):
+    """
+    Serializer for replacing the cart with the given items, or merging them into it.
+
+    Replace drops the items missing from the request, while merge adds the quantities to the existing items,
+    e.g. to merge a guest cart at login. All items are validated with a single query and written with one upsert.
+    """
+
+    items = CartItemSerializer(many=True, allow_empty=True)
+    mode = serializers.ChoiceField(choices=CartSyncMode.choices, default=CartSyncMode.REPLACE)
+
+    def validate(self, data: dict):
+        """Validate if every product exists and has enough stock for the resulting quantity."""
+        user = self.context["request"].user
+
+        slugs = {item["product"] for item in data["items"]}
+        products = {product.slug: product for product in Product.objects.filter(slug__in=slugs)}
+
+        missing = slugs - products.keys()
+
+        if missing:
+            raise serializers.ValidationError([f'"{slug}" adlı məhsul tapılmadı' for slug in sorted(missing)])
+
+        quantities = defaultdict(int)
+
+        for item in data["items"]:
+            quantities[products[item["product"]].pk] += item["quantity"]
+
+        if data["mode"] == CartSyncMode.MERGE:
+            for product_id, quantity in user.cart.filter(product__in=quantities).values_list("product", "quantity"):
+                quantities[product_id] += quantity
+
+        errors = get_stock_errors(quantities, {product.pk: product for product in products.values()})
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        data["quantities"] = quantities
+
+        return data
+
+    def create(self, validated_data: dict):
+        """Write the items to the cart of the authenticated user."""
+        user = self.context["request"].user
+        quantities = {
+            product_id: quantity for product_id, quantity in validated_data["quantities"].items() if quantity
+        }
+
+        with transaction.atomic():
+            if validated_data["mode"] == CartSyncMode.REPLACE:
+                user.cart.exclude(product__in=quantities).delete()
+
+            Cart.objects.bulk_create(
+                [
+                    Cart(user=user, product_id=product_id, quantity=quantity)
+                    for product_id, quantity in quantities.items()
+                ],
+                update_conflicts=True,
+                unique_fields=("user", "product"),
+                update_fields=("quantity", "updated_at"),
+            )
+
+        return user.cart.all()
+
+
+class CartSummaryItemSerializer(serializers.Serializer):
+    """Serializer for price summary of a cart item."""
+
+    product = serializers.CharField(source="product__slug")
+    quantity = serializers.IntegerField()
+    price = serializers.DecimalField(source="product__price", max_digits=10, decimal_places=2)
+    discount = serializers.IntegerField()
+    is_promo_applied = serializers.BooleanField()
+    final_price = serializers.DecimalField(max_digits=10, decimal_places=2)
+    subtotal = serializers.DecimalField(max_digits=10, decimal_places=2)
+    total = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+
+class CartSummarySerializer(serializers.Serializer):
+    """Serializer for price summary of the cart."""
+
+    items = CartSummaryItemSerializer(many=True)
+    code_discount = serializers.IntegerField()
+    subtotal = serializers.DecimalField(max_digits=10, decimal_places=2)
+    discount_total = serializers.DecimalField(max_digits=10, decimal_places=2)
+    promo_discount_total = serializers.DecimalField(max_digits=10, decimal_places=2)
+    total = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+
 class DeviceTokenSerializer(serializers.Serializer):
     """Serializer for device token."""
 
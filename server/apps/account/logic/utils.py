@@ -0,0 +1,87 @@
+from array import array
+from decimal import Decimal
+from time import time_ns
+
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.request import Request
+
+from server.apps.account.models import Favorite
+from server.apps.order.logic.utils import get_code_discount
+
+FAVORITE_IDS_KEY_PREFIX = "favorites"
+
+
+def get_favorite_ids_version_key(user_id: int) -> str:
+    """Get cache key of the version of the cached favorite product ids of the user."""
+    return f"{FAVORITE_IDS_KEY_PREFIX}:version:{user_id}"
+
+
+def get_favorite_ids_key(user_id: int, version: int) -> str:
+    """Get cache key of the favorite product ids of the user at the version."""
+    return f"{FAVORITE_IDS_KEY_PREFIX}:{user_id}:{version}"
+
+
+def get_favorite_ids(request: Request) -> set:
+    """
+    Get ids of the products favorited by the authenticated user.
+
+    The ids are cached per user as a sorted int array, and memoized on the request,
+    so every product serialized during the request reuses the same set.
+    The cache key includes the version of the user, so ids read before a change are never
+    served after it, even when they are stored after the change is invalidated.
+    """
+    if not hasattr(request, "_favorite_ids"):
+        version = cache.get_or_set(get_favorite_ids_version_key(request.user.pk), time_ns, timeout=None)
+        key = get_favorite_ids_key(request.user.pk, version)
+        ids = cache.get(key)
+
+        if ids is None:
+            ids = array("Q", sorted(Favorite.objects.filter(user=request.user).values_list("product_id", flat=True)))
+            cache.set(key, ids)
+
+        request._favorite_ids = set(ids)
+
+    return request._favorite_ids
+
+
+def invalidate_favorite_ids(user_id: int) -> None:
+    """Move the cached favorite product ids of the user to a new version after the favorites are committed."""
+    transaction.on_commit(lambda: cache.set(get_favorite_ids_version_key(user_id), time_ns(), timeout=None))
+
+
+def get_cart_summary(user, code: str = None) -> dict:
+    """
+    Get line totals, discounts, promo effect and grand total of the cart of the user.
+
+    Line prices are computed by the database over the cart and product join in a single query.
+    The code is only checked here, its usage is recorded at checkout.
+    """
+    code_discount = get_code_discount(code, user)[0]
+
+    items = list(
+        user.cart.with_prices(code_discount).values(
+            "product__slug",
+            "product__price",
+            "quantity",
+            "discount",
+            "is_promo_applied",
+            "final_price",
+            "subtotal",
+            "total",
+        )
+    )
+
+    subtotal = sum((item["subtotal"] for item in items), Decimal(0))
+    total = sum((item["total"] for item in items), Decimal(0))
+
+    return {
+        "items": items,
+        "code_discount": code_discount,
+        "subtotal": subtotal,
+        "discount_total": subtotal - total,
+        "promo_discount_total": sum(
+            (item["subtotal"] - item["total"] for item in items if item["is_promo_applied"]), Decimal(0)
+        ),
+        "total": total,
+    }
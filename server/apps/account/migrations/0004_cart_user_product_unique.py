@@ -0,0 +1,37 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:13
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def merge_duplicate_cart_items(apps, schema_editor):
+    """Merge cart items of the same user and product into the latest one, summing their quantities."""
+    Cart = apps.get_model("account", "Cart")
+
+    duplicates = Cart.objects.values("user", "product").annotate(count=Count("id")).filter(count__gt=1).order_by()
+
+    for duplicate in duplicates:
+        items = list(Cart.objects.filter(user=duplicate["user"], product=duplicate["product"]).order_by("-updated_at"))
+
+        items[0].quantity = sum(item.quantity for item in items)
+        items[0].save(update_fields=["quantity"])
+
+        Cart.objects.filter(pk__in=[item.pk for item in items[1:]]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0003_alter_cart_options_alter_favorite_options"),
+        ("product", "0014_product_final_price"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_cart_items, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="cart",
+            constraint=models.UniqueConstraint(fields=("user", "product"), name="cart_user_product_unique"),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:16
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Min, Subquery
+
+
+def delete_duplicate_favorites(apps, schema_editor):
+    """Delete favorites of the same user and product, keeping the earliest one."""
+    Favorite = apps.get_model("account", "Favorite")
+
+    kept = Favorite.objects.values("user", "product").annotate(first_id=Min("id")).order_by()
+
+    Favorite.objects.exclude(pk__in=Subquery(kept.values("first_id"))).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0004_cart_user_product_unique"),
+        ("product", "0014_product_final_price"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_favorites, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="favorite",
+            constraint=models.UniqueConstraint(fields=("user", "product"), name="favorite_user_product_unique"),
+        ),
+    ]
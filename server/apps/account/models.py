@@ -1,5 +1,6 @@
 from django.db import models
 
+from server.apps.account.logic.queryset import CartQuerySet
 from server.apps.core.models import TimeStampedModel
 
 
@@ -15,6 +16,8 @@ class Favorite(TimeStampedModel):
 
         ordering = ("-created_at",)
 
+        constraints = (models.UniqueConstraint(fields=("user", "product"), name="favorite_user_product_unique"),)
+
     def __str__(self):
         """Unicode representation of Favorite."""
         return f"{self.user} - {self.product}"
@@ -27,12 +30,16 @@ class Cart(TimeStampedModel):
     product = models.ForeignKey("product.Product", on_delete=models.CASCADE, related_name="cart")
     quantity = models.PositiveIntegerField(default=0)
 
+    objects = CartQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Cart"
         verbose_name_plural = "Cart"
 
         ordering = ("-created_at",)
 
+        constraints = (models.UniqueConstraint(fields=("user", "product"), name="cart_user_product_unique"),)
+
     def __str__(self):
         """Unicode representation of Cart."""
         return f"{self.user} - {self.product}"
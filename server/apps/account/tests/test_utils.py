@@ -0,0 +1,38 @@
+from array import array
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+
+from server.apps.account.logic.utils import (
+    get_favorite_ids,
+    get_favorite_ids_key,
+    get_favorite_ids_version_key,
+    invalidate_favorite_ids,
+)
+from server.apps.account.models import Favorite
+from server.apps.user.models import User
+
+
+@pytest.mark.django_db
+def test_favorite_ids_filled_before_invalidate_are_not_served(
+    user: User, create_product, django_capture_on_commit_callbacks
+) -> None:
+    """Ids read by a request before a change and stored after its invalidation are never served."""
+    first, second = create_product(0), create_product(1)
+    Favorite.objects.create(user=user, product=first)
+
+    assert get_favorite_ids(SimpleNamespace(user=user)) == {first.pk}
+
+    # A slow request reads the version and the favorites before the change...
+    version = cache.get(get_favorite_ids_version_key(user.pk))
+    stale_ids = array("Q", [first.pk])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Favorite.objects.create(user=user, product=second)
+        invalidate_favorite_ids(user.pk)
+
+    # ...and stores them after the change is invalidated
+    cache.set(get_favorite_ids_key(user.pk, version), stale_ids)
+
+    assert get_favorite_ids(SimpleNamespace(user=user)) == {first.pk, second.pk}
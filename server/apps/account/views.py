@@ -1,17 +1,23 @@
+from django.db.models import Prefetch
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
-from rest_framework import generics, permissions, status
+from rest_framework import generics, parsers, permissions, status
 from rest_framework.response import Response
 
 from server.apps.account.logic.serializers import (
     AccountSerializer,
     CartSerializer,
+    CartSummarySerializer,
+    CartSyncSerializer,
     ChangePasswordSerializer,
     DeviceTokenSerializer,
+    FavoriteBulkSerializer,
     FavoriteSerializer,
 )
+from server.apps.account.logic.utils import get_cart_summary, invalidate_favorite_ids
 from server.apps.account.models import Cart, Favorite
-from server.apps.core.logic.responses import UNAUTHORIZED
+from server.apps.core.logic.responses import BAD_REQUEST, UNAUTHORIZED
 from server.apps.product.logic.serializers import ProductSerializer
+from server.apps.product.models import Product
 
 
 class AccountView(generics.RetrieveUpdateDestroyAPIView):
@@ -90,8 +96,10 @@ class FavoriteView(generics.ListCreateAPIView):
     ordering_fields = "__all__"
 
     def get_queryset(self):
-        """Return favorite products of the authenticated user."""
-        return self.request.user.favorites.all()
+        """Return favorite products of the authenticated user with their related objects prefetched."""
+        return self.request.user.favorites.prefetch_related(
+            Prefetch("product", queryset=Product.objects.get_related())
+        )
 
     @extend_schema(
         responses={
@@ -134,6 +142,30 @@ class FavoriteView(generics.ListCreateAPIView):
             return Response({"detail": "Favorite not found."}, status=status.HTTP_404_NOT_FOUND)
 
         favorite.delete()
+        invalidate_favorite_ids(request.user.pk)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class FavoriteBulkView(generics.GenericAPIView):
+    """View for adding and removing favorite products in bulk."""
+
+    serializer_class = FavoriteBulkSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [parsers.JSONParser, parsers.MultiPartParser, parsers.FormParser]
+
+    @extend_schema(
+        responses={
+            status.HTTP_204_NO_CONTENT: None,
+            status.HTTP_400_BAD_REQUEST: BAD_REQUEST,
+            status.HTTP_401_UNAUTHORIZED: UNAUTHORIZED,
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        """Add and remove favorite products of authenticated user by product slugs."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -144,12 +176,13 @@ class CartView(generics.ListCreateAPIView):
     queryset = Cart.objects.none()
     serializer_class = CartSerializer
     permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [parsers.JSONParser, parsers.MultiPartParser, parsers.FormParser]
 
     pagination_class = None
 
     def get_queryset(self):
-        """Return products in cart of the authenticated user."""
-        return self.request.user.cart.all()
+        """Return products in cart of the authenticated user with their related objects prefetched."""
+        return self.request.user.cart.prefetch_related(Prefetch("product", queryset=Product.objects.get_related()))
 
     @extend_schema(
         responses={
@@ -171,6 +204,25 @@ class CartView(generics.ListCreateAPIView):
         """Add a product to cart of authenticated user."""
         return super().post(request, *args, **kwargs)
 
+    @extend_schema(
+        request=CartSyncSerializer,
+        responses={
+            status.HTTP_200_OK: CartSerializer(many=True),
+            status.HTTP_400_BAD_REQUEST: BAD_REQUEST,
+            status.HTTP_401_UNAUTHORIZED: UNAUTHORIZED,
+        },
+    )
+    def put(self, request, *args, **kwargs):
+        """Replace cart of authenticated user with the given products, or merge them into it."""
+        serializer = CartSyncSerializer(data=request.data, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(
+            self.get_serializer(self.get_queryset(), many=True).data,
+            status=status.HTTP_200_OK,
+        )
+
     @extend_schema(
         responses={
             status.HTTP_204_NO_CONTENT: None,
@@ -196,6 +248,30 @@ class CartView(generics.ListCreateAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class CartSummaryView(generics.GenericAPIView):
+    """View for price summary of the cart."""
+
+    serializer_class = CartSummarySerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    pagination_class = None
+
+    @extend_schema(
+        responses={
+            status.HTTP_200_OK: CartSummarySerializer,
+            status.HTTP_401_UNAUTHORIZED: UNAUTHORIZED,
+        },
+        parameters=[
+            OpenApiParameter(name="code", required=False, type=str, location=OpenApiParameter.QUERY),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        """Retrieve line totals, discounts and grand total of cart of the authenticated user."""
+        summary = get_cart_summary(request.user, request.query_params.get("code"))
+
+        return Response(self.get_serializer(summary).data, status=status.HTTP_200_OK)
+
+
 class DeviceTokenView(generics.CreateAPIView):
     """View for device token management."""
 
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
-from server.apps.auth.logic.utils import get_token_pair, send_otp_code
+from server.apps.auth.logic.utils import get_token_pair
+from server.apps.auth.tasks import send_otp_code_task
 from server.apps.user.models import User
 
 
@@ -60,8 +61,9 @@ class SendOTPCodeSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         user = User.objects.get(phone=validated_data["phone"])
+        user.generate_otp_code()
 
-        send_otp_code(user)
+        send_otp_code_task.delay(user.id)
 
         return user
 
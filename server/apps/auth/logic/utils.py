@@ -24,13 +24,13 @@ class CustomAdapter(HTTPAdapter):
 
 
 def send_otp_code(user: User) -> None:
-    """Send OTP code to user phone number."""
+    """Send the generated OTP code to user phone number."""
     data = {
         "login": config("SMS_LOGIN"),
         "key": md5(config("SMS_PASSWORD").encode()).hexdigest(),
         "sender": config("SMS_SENDER"),
         "scheduled": "NOW",
-        "text": f"Sizin OTP kodunuz: {user.generate_otp_code()}",
+        "text": f"Sizin OTP kodunuz: {user.otp_code}",
         "msisdn": f"994{user.phone}",
         "unicode": 0,
     }
@@ -46,7 +46,7 @@ def send_otp_code(user: User) -> None:
         raise ValueError(f"Something went wrong. Error code: {trans_id}")
 
     user.otp_trans_id = trans_id
-    user.save()
+    user.save(update_fields=["otp_trans_id"])
 
 
 def get_token_pair(user: User) -> dict:
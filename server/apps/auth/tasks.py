@@ -0,0 +1,9 @@
+from server.apps.auth.logic.utils import send_otp_code
+from server.apps.task.logic.utils import task
+from server.apps.user.models import User
+
+
+@task(max_attempts=3)
+def send_otp_code_task(user_id: int):
+    """Send the current OTP code of the user by SMS."""
+    send_otp_code(User.objects.get(pk=user_id))
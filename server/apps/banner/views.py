@@ -4,14 +4,17 @@ from rest_framework import status, viewsets
 from server.apps.banner.logic.serializers import BannerSerializer
 from server.apps.banner.models import Banner
 from server.apps.core.logic import responses
+from server.apps.core.logic.mixins import CachedResponseMixin
 
 
-class BannerViewSet(viewsets.ModelViewSet):
+class BannerViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """Viewset for Banner model."""
 
     queryset = Banner.objects.none()
     serializer_class = BannerSerializer
 
+    cache_models = ("banner.Banner",)
+
     ordering_fields = ("__all__",)
 
     lookup_field = "id"
@@ -5,14 +5,17 @@ from server.apps.brand.logic.filters import BrandFilter
 from server.apps.brand.logic.serializers import BrandSerializer
 from server.apps.brand.models import Brand
 from server.apps.core.logic import responses
+from server.apps.core.logic.mixins import CachedResponseMixin, StreamingListMixin
 
 
-class BrandViewSet(viewsets.ModelViewSet):
+class BrandViewSet(CachedResponseMixin, StreamingListMixin, viewsets.ModelViewSet):
     """Viewset for Brand model."""
 
     queryset = Brand.objects.none()
     serializer_class = BrandSerializer
 
+    cache_models = ("brand.Brand",)
+
     filterset_class = BrandFilter
     ordering_fields = ("__all__",)
 
@@ -29,5 +29,5 @@ class Category(SlugModel, MPTTModel):
         return slugify(f"{self.name}-{randint(0, 1000)}")
 
     def get_children(self):
-        """Get children of the category."""
-        return self.children.all().order_by(*self._meta.ordering)
+        """Get children of the category, served from the prefetched ones when available."""
+        return self.children.all()
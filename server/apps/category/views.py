@@ -5,14 +5,17 @@ from server.apps.category.logic.filters import CategoryFilter
 from server.apps.category.logic.serializers import CategorySerializer
 from server.apps.category.models import Category
 from server.apps.core.logic import responses
+from server.apps.core.logic.mixins import CachedResponseMixin, StreamingListMixin
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(CachedResponseMixin, StreamingListMixin, viewsets.ModelViewSet):
     """Viewset for Category model."""
 
     queryset = Category.objects.none()
     serializer_class = CategorySerializer
 
+    cache_models = ("category.Category",)
+
     filterset_class = CategoryFilter
     ordering_fields = ("__all__",)
 
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "server.apps.core"
+
+    def ready(self):
+        """Connect signal receivers."""
+        import server.apps.core.signals  # noqa: F401
@@ -0,0 +1,70 @@
+from hashlib import md5
+from time import time_ns
+
+from django.core.cache import caches
+from django.utils.translation import get_language
+from rest_framework.request import Request
+
+VERSION_KEY_PREFIX = "version"
+RESPONSE_KEY_PREFIX = "response"
+VERSIONS_CACHE_ALIAS = "versions"
+
+
+def get_version_key(label: str) -> str:
+    """Get cache key of the version counter for the model label."""
+    return f"{VERSION_KEY_PREFIX}:{label}"
+
+
+def get_versions(labels: tuple) -> list:
+    """
+    Get current version counters for the model labels.
+
+    Counters live in their own never culled cache. A missing counter is started from
+    the current time, so a lost counter never returns to a version used before.
+    """
+    versions_cache = caches[VERSIONS_CACHE_ALIAS]
+    keys = [get_version_key(label) for label in labels]
+    versions = versions_cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            versions_cache.add(key, time_ns(), timeout=None)
+            versions[key] = versions_cache.get(key)
+
+    return [versions[key] for key in keys]
+
+
+def bump_version(label: str) -> None:
+    """
+    Move version of the model label forward, invalidating every entry built from it.
+
+    A fresh timestamp is written instead of incrementing, as ``incr`` of the file cache is not atomic
+    and concurrent bumps of different workers could be lost.
+    """
+    caches[VERSIONS_CACHE_ALIAS].set(get_version_key(label), time_ns(), timeout=None)
+
+
+def get_query_key(request: Request, only=None) -> str:
+    """
+    Get normalized representation of the query params of the request.
+
+    When ``only`` is given, the other params and the empty values are left out.
+    """
+    params = request.query_params
+    keys = sorted(params) if only is None else sorted(key for key in params if key in only)
+    values = {key: sorted(value for value in params.getlist(key) if only is None or value) for key in keys}
+
+    return "&".join(f"{key}={value}" for key in keys for value in values[key])
+
+
+def get_response_key(request: Request, labels: tuple, only=None) -> str:
+    """
+    Get cache key for the response of the request.
+
+    The key is built from the absolute path, normalized query params, active language
+    and the versions of the models the response depends on.
+    """
+    versions = ":".join(str(version) for version in get_versions(labels))
+    raw = f"{request.build_absolute_uri(request.path)}?{get_query_key(request, only)}|{get_language()}|{versions}"
+
+    return f"{RESPONSE_KEY_PREFIX}:{md5(raw.encode()).hexdigest()}"
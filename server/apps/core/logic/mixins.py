@@ -0,0 +1,85 @@
+from itertools import islice
+
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.utils import translation
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from server.apps.core.logic.caching import get_response_key
+
+
+class CachedResponseMixin:
+    """
+    Cache ``list`` and ``retrieve`` responses for anonymous users.
+
+    Entries are invalidated by bumping the version counters of ``cache_models``,
+    which is done by the ``post_save`` and ``post_delete`` signal receivers.
+    """
+
+    cache_models = ()
+    cache_timeout = 60 * 60
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        """Return cached response data if available, otherwise call the handler and cache its result."""
+        if request.user.is_authenticated:
+            return handler(request, *args, **kwargs)
+
+        key = get_response_key(request, self.cache_models)
+        data = cache.get(key)
+
+        if data is not None:
+            return Response(data)
+
+        response = handler(request, *args, **kwargs)
+
+        if isinstance(response, Response) and response.status_code == 200:
+            cache.set(key, response.data, timeout=self.cache_timeout)
+
+        return response
+
+
+class StreamingListMixin:
+    """
+    Stream ``list`` responses as a JSON array when pagination is disabled with ``limit=all``.
+
+    Instances are fetched with a chunked ``iterator()``, prefetched and serialized chunk by chunk,
+    so the memory usage does not grow with the size of the queryset.
+    """
+
+    stream_chunk_size = 200
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("limit") != "all":
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+
+        return StreamingHttpResponse(
+            self.stream_queryset(queryset, translation.get_language()), content_type="application/json"
+        )
+
+    def stream_queryset(self, queryset, language: str):
+        """Yield the serialized queryset as parts of a JSON array."""
+        renderer = JSONRenderer()
+        instances = queryset.iterator(chunk_size=self.stream_chunk_size)
+
+        yield b"["
+
+        with translation.override(language):
+            separator = b""
+
+            while chunk := list(islice(instances, self.stream_chunk_size)):
+                data = self.get_serializer(chunk, many=True).data
+
+                yield separator + renderer.render(data)[1:-1]
+
+                separator = b","
+
+        yield b"]"
@@ -1,17 +1,83 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class CustomCursorPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination class for the API.
+
+    Pages are fetched by ``created_at`` position instead of ``OFFSET`` and no ``COUNT(*)`` query is made.
+    """
+
+    page_size = 12
+    page_size_query_param = "limit"
+    max_page_size = 100
+
+    ordering = ("-created_at", "-id")
 
 
 class CustomPagination(PageNumberPagination):
-    """Custom pagination class for the API."""
+    """
+    Custom pagination class for the API.
+
+    Cursor pagination is used instead when the request asks for it
+    with ``pagination=cursor`` or already holds a ``cursor``.
+    """
 
     page_size = 12
     page_size_query_param = "limit"
     max_page_size = 100
 
+    pagination_query_param = "pagination"
+    cursor_pagination_class = CustomCursorPagination
+
+    cursor_pagination = None
+
     def paginate_queryset(self, queryset, request, view=None):
         """Paginate the queryset if the limit query param is not 'all'."""
 
         if request.query_params.get("limit") == "all":
             return None
 
+        if self.is_cursor_request(request):
+            self.cursor_pagination = self.cursor_pagination_class()
+            return self.cursor_pagination.paginate_queryset(queryset, request, view)
+
         return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        """Return the paginated response of the used pagination style."""
+
+        if self.cursor_pagination is not None:
+            return self.cursor_pagination.get_paginated_response(data)
+
+        return super().get_paginated_response(data)
+
+    def is_cursor_request(self, request):
+        """Check if the request asks for cursor pagination."""
+        return (
+            request.query_params.get(self.pagination_query_param) == "cursor"
+            or self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+    def get_schema_operation_parameters(self, view):
+        """Document the cursor pagination query params alongside the page number ones."""
+        parameters = super().get_schema_operation_parameters(view)
+
+        parameters += [
+            {
+                "name": self.pagination_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to 'cursor' to use cursor pagination.",
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            {
+                "name": self.cursor_pagination_class.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.cursor_pagination_class.cursor_query_description),
+                "schema": {"type": "string"},
+            },
+        ]
+
+        return parameters
@@ -0,0 +1,29 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from server.apps.core.logic.caching import bump_version
+
+# Models whose changes invalidate the cached responses.
+CACHE_VERSIONED_MODELS = (
+    "product.Product",
+    "product.ProductImage",
+    "brand.Brand",
+    "category.Category",
+    "banner.Banner",
+)
+
+
+def invalidate_cached_responses(sender, **kwargs):
+    """
+    Bump version counter of the changed model once the change is committed.
+
+    Bumping inside the transaction would let a request cache the old rows under the new version.
+    """
+    transaction.on_commit(partial(bump_version, sender._meta.label))
+
+
+for label in CACHE_VERSIONED_MODELS:
+    post_save.connect(invalidate_cached_responses, sender=label, dispatch_uid=f"{label}_post_save_cache")
+    post_delete.connect(invalidate_cached_responses, sender=label, dispatch_uid=f"{label}_post_delete_cache")
@@ -0,0 +1,38 @@
+import pytest
+from django.core.cache import cache, caches
+
+from server.apps.core.logic.caching import bump_version, get_version_key, get_versions, VERSIONS_CACHE_ALIAS
+
+LABEL = "product.Product"
+
+
+def test_version_survives_response_cache_eviction():
+    (version,) = get_versions((LABEL,))
+    bump_version(LABEL)
+
+    cache.clear()
+
+    assert get_versions((LABEL,))[0] > version
+
+
+def test_lost_version_does_not_return_to_used_version():
+    bump_version(LABEL)
+    bump_version(LABEL)
+    (version,) = get_versions((LABEL,))
+
+    caches[VERSIONS_CACHE_ALIAS].delete(get_version_key(LABEL))
+
+    assert get_versions((LABEL,))[0] > version
+
+
+@pytest.mark.django_db
+def test_version_is_bumped_after_commit(create_product, django_capture_on_commit_callbacks) -> None:
+    """Changes of the cached models bump the version only once they are committed."""
+    (version,) = get_versions((LABEL,))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_product()
+
+        assert get_versions((LABEL,)) == [version]
+
+    assert get_versions((LABEL,))[0] > version
@@ -6,3 +6,7 @@ class NotificationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "server.apps.notification"
     verbose_name = _("Notification")
+
+    def ready(self):
+        """Connect signal receivers."""
+        import server.apps.notification.signals  # noqa: F401
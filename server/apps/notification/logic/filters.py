@@ -9,9 +9,9 @@ class NotificationFilter(filters.FilterSet):
     title = filters.CharFilter(field_name="title", lookup_expr="icontains")
     body = filters.CharFilter(field_name="body", lookup_expr="icontains")
 
-    date = filters.DateTimeFilter(field_name="date")
-    date_start = filters.DateTimeFilter(field_name="date", lookup_expr="gte")
-    date_end = filters.DateTimeFilter(field_name="date", lookup_expr="lte")
+    date = filters.DateTimeFilter(field_name="created_at")
+    date_start = filters.DateTimeFilter(field_name="created_at", lookup_expr="gte")
+    date_end = filters.DateTimeFilter(field_name="created_at", lookup_expr="lte")
 
     class Meta:
         model = Notification
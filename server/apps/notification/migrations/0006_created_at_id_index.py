@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-18 11:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notification", "0005_alter_notification_options_remove_notification_date"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(fields=["-created_at", "-id"], name="notification_created_at_id_idx"),
+        ),
+    ]
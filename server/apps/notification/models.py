@@ -23,6 +23,8 @@ class Notification(TimeStampedModel):
 
         ordering = ("-created_at",)
 
+        indexes = (models.Index(fields=("-created_at", "-id"), name="notification_created_at_id_idx"),)
+
     def __str__(self):
         """Unicode representation of Notification."""
         return self.title
@@ -48,8 +50,3 @@ class Notification(TimeStampedModel):
         response = messaging.send(message)
 
         self.message_id = response
-
-    def save(self, *args, **kwargs):
-        """Save method for Notification."""
-        self.send_notification()
-        super().save(*args, **kwargs)
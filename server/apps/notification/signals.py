@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from server.apps.notification.models import Notification
+from server.apps.notification.tasks import send_notification_task
+
+
+@receiver(post_save, sender=Notification, dispatch_uid="notification_post_save_send")
+def send_created_notification(sender, instance, created, **kwargs):
+    """Enqueue sending of the created notification."""
+    if created:
+        send_notification_task.apply_async(args=(instance.pk,), key=f"notification:{instance.pk}:send")
@@ -0,0 +1,15 @@
+from server.apps.notification.models import Notification
+from server.apps.task.logic.utils import task
+
+
+@task
+def send_notification_task(notification_id: int):
+    """Send the notification with Firebase and store its message id, unless it is already sent."""
+    notification = Notification.objects.select_related("user").get(pk=notification_id)
+
+    if notification.message_id:
+        return
+
+    notification.send_notification()
+
+    Notification.objects.filter(pk=notification_id).update(message_id=notification.message_id)
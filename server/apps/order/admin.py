@@ -12,7 +12,8 @@ class OrderItemInline(admin.TabularInline):
     model = OrderItem
 
     fields = (
-        "product",
+        "product_code",
+        "product_name",
         "quantity",
         "get_price",
         "total",
@@ -31,7 +32,7 @@ class OrderItemInline(admin.TabularInline):
 
     total.short_description = _("Total")
 
-    readonly_fields = ("product", "quantity", "get_price", "total")
+    readonly_fields = ("product_code", "product_name", "quantity", "get_price", "total")
 
     def has_add_permission(self, request, obj=None):
         """Disable add permission."""
@@ -77,7 +78,7 @@ class OrderAdmin(ModelAdmin):
         "code",
         "user",
         "status",
-        "total",
+        "get_total",
     )
 
     search_fields = (
@@ -85,8 +86,9 @@ class OrderAdmin(ModelAdmin):
         "user__phone",
         "user__first_name",
         "user__last_name",
-        "items__product__name",
-        "items__product__code",
+        "items__product_name_az",
+        "items__product_name_ru",
+        "items__product_code",
     )
 
     list_filter = ("status",)
@@ -96,10 +98,11 @@ class OrderAdmin(ModelAdmin):
 
     code.short_description = _("Order")
 
-    def total(self, obj):
-        return f"{obj.get_total():.2f} AZN"
+    def get_total(self, obj):
+        return f"{obj.total:.2f} AZN"
 
-    total.short_description = _("Total")
+    get_total.short_description = _("Total")
+    get_total.admin_order_field = "total"
 
     def contact(self, obj):
         return mark_safe(f'<a href="tel:+994{obj.user.phone}">+994{obj.user.phone}</a>')
@@ -112,7 +115,9 @@ class OrderAdmin(ModelAdmin):
         "contact",
         "address",
         "note",
-        "total",
+        "subtotal",
+        "discount_total",
+        "get_total",
         "payment_method",
     )
 
@@ -125,7 +130,9 @@ class OrderAdmin(ModelAdmin):
                     "user",
                     "contact",
                     "address",
-                    "total",
+                    "subtotal",
+                    "discount_total",
+                    "get_total",
                     "payment_method",
                     "note",
                 )
@@ -0,0 +1,213 @@
+import threading
+import time
+from functools import lru_cache
+from xml.parsers.expat import ExpatError
+
+import requests
+import xmltodict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from server.settings.components import config
+
+
+class BankGatewayError(Exception):
+    """Raised when the bank gateway request fails."""
+
+
+class BankGatewayUnavailable(BankGatewayError):
+    """Raised when the circuit breaker is open and the bank gateway is not called."""
+
+
+def cast_verify(value: str):
+    """Cast the certificate verification setting to a boolean, or keep it as the path of a CA bundle."""
+    if value.lower() in ("true", "yes", "on", "1"):
+        return True
+
+    if value.lower() in ("false", "no", "off", "0", ""):
+        return False
+
+    return value
+
+
+class CircuitBreaker:
+    """
+    Stop calling the bank gateway for ``reset_timeout`` seconds after ``failure_threshold`` consecutive failures.
+
+    After the timeout a single trial call is let through, which closes the circuit again on success.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check if a call is allowed."""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                # Half-open: let a trial call through and wait for its result
+                self.opened_at = time.monotonic()
+                return True
+
+            return False
+
+    def record_success(self):
+        """Close the circuit."""
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        """Count the failure and open the circuit when the threshold is reached."""
+        with self.lock:
+            self.failures += 1
+
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class BankGatewayClient:
+    """
+    Client of the TKKPG XML bank gateway.
+
+    Connections are pooled in a single session, which keeps the client certificate loaded between requests.
+    Every request is bounded by connect and read timeouts. Connection errors are retried for all operations,
+    as the request has not reached the bank, while timeouts and server errors are retried only
+    for the idempotent operations.
+    """
+
+    IDEMPOTENT_OPERATIONS = ("GetOrderStatus", "GetOrderInformation")
+
+    def __init__(
+        self,
+        url: str,
+        merchant: str,
+        cert: tuple = None,
+        verify=True,
+        connect_timeout: float = 5,
+        read_timeout: float = 30,
+        retries: int = 2,
+        pool_size: int = 10,
+        circuit_breaker: CircuitBreaker = None,
+    ):
+        self.url = url
+        self.merchant = merchant
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(failure_threshold=5, reset_timeout=30)
+
+        self.session = requests.Session()
+        self.session.cert = cert
+        self.session.verify = verify
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=None, connect=retries, read=0, status=0, other=0, backoff_factor=0.2),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def from_config(cls):
+        """Create the client from the project configuration."""
+        cert = config("BANK_CERT", default="")
+
+        return cls(
+            url=config("BANK_URL"),
+            merchant=config("BANK_MERCHANT"),
+            cert=(cert, config("BANK_KEY")) if cert else None,
+            verify=config("BANK_VERIFY", cast=cast_verify, default="True"),
+            connect_timeout=config("BANK_CONNECT_TIMEOUT", cast=float, default=5),
+            read_timeout=config("BANK_READ_TIMEOUT", cast=float, default=30),
+            retries=config("BANK_RETRIES", cast=int, default=2),
+            pool_size=config("BANK_POOL_SIZE", cast=int, default=10),
+        )
+
+    def request(self, operation: str, data: dict, *keys: str):
+        """
+        Send the operation request to the bank gateway and return its response, or its value at the ``keys``.
+
+        Malformed responses are counted as failures of the gateway.
+        """
+        if not self.circuit_breaker.allow():
+            raise BankGatewayUnavailable("Bank gateway is unavailable.")
+
+        xml = xmltodict.unparse({"TKKPG": {"Request": {"Operation": operation, **data}}})
+        attempts = 1 + (self.retries if operation in self.IDEMPOTENT_OPERATIONS else 0)
+
+        for attempt in range(attempts):
+            try:
+                response = self.session.post(self.url, data=xml, timeout=self.timeout)
+                response.raise_for_status()
+            except requests.RequestException as error:
+                if attempt + 1 < attempts and not isinstance(error, requests.ConnectionError):
+                    time.sleep(0.2 * 2**attempt)
+                    continue
+
+                self.circuit_breaker.record_failure()
+                raise BankGatewayError(f"{operation} request failed: {error}") from error
+
+            break
+
+        try:
+            result = xmltodict.parse(response.text)["TKKPG"]["Response"]
+            status = result["Status"]
+
+            if status == "00":
+                for key in keys:
+                    result = result[key]
+        except (ExpatError, KeyError, TypeError) as error:
+            self.circuit_breaker.record_failure()
+            raise BankGatewayError(f"{operation} request returned a malformed response: {error!r}") from error
+
+        self.circuit_breaker.record_success()
+
+        if status != "00":
+            raise BankGatewayError(f"{operation} request failed with status {status}.")
+
+        return result
+
+    def create_order(self, redirect_url: str, amount, installments: int = 0, language: str = "AZ") -> dict:
+        """Create a purchase order and return its ``OrderID``, ``SessionID`` and payment page ``URL``."""
+        data = {
+            "Language": language,
+            "Order": {
+                "OrderType": "Purchase",
+                "Merchant": self.merchant,
+                "Amount": int(amount * 100),
+                "Currency": "944",
+                "Description": f"TAKSIT={installments}" if installments > 0 else "xxxxxxxx",
+                "ApproveURL": f"{redirect_url}?status=approved",
+                "CancelURL": f"{redirect_url}?status=canceled",
+                "DeclineURL": f"{redirect_url}?status=declined",
+            },
+        }
+
+        return self.request("CreateOrder", data, "Order")
+
+    def get_order_status(self, order_id: str, session_id: str, language: str = "AZ") -> str:
+        """Get status of the order, such as ``APPROVED`` or ``DECLINED``."""
+        data = {
+            "Language": language,
+            "Order": {
+                "Merchant": self.merchant,
+                "OrderID": order_id,
+            },
+            "SessionID": session_id,
+        }
+
+        return self.request("GetOrderStatus", data, "Order", "OrderStatus")
+
+
+@lru_cache(maxsize=None)
+def get_bank_client() -> BankGatewayClient:
+    """Get the bank gateway client shared by the process."""
+    return BankGatewayClient.from_config()
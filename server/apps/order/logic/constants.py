@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from django.db import models
 
 
@@ -17,6 +19,7 @@ class OrderStatus(models.IntegerChoices):
     ON_DELIVERY = 2, "Yoldadır"
     COMPLETED = 3, "Çatdırıldı"
     CANCELED = 4, "Ləğv edildi"
+    REFUND = 5, "Geri ödənilməlidir"
 
 
 class OrderPaymentStatus(models.IntegerChoices):
@@ -26,3 +29,37 @@ class OrderPaymentStatus(models.IntegerChoices):
     APPROVED = 1, "Təsdiqlənib"
     DECLINED = 2, "Rədd edilib"
     CANCELED = 3, "Ləğv edilib"
+
+
+# Time during which a created bank payment session is reused instead of creating a new one
+PAYMENT_SESSION_LIFETIME = timedelta(minutes=20)
+
+# Seconds checkout waits for a worker creating the payment session of the order
+PAYMENT_TASK_TIMEOUT = 15
+
+# Statuses a payment can be moved from to the status reported by the bank,
+# so repeated callbacks never move it backwards. Approved payments are final.
+PAYMENT_STATUS_TRANSITIONS = {
+    OrderPaymentStatus.APPROVED: (
+        OrderPaymentStatus.ON_PAYMENT,
+        OrderPaymentStatus.DECLINED,
+        OrderPaymentStatus.CANCELED,
+    ),
+    OrderPaymentStatus.DECLINED: (OrderPaymentStatus.ON_PAYMENT,),
+    OrderPaymentStatus.CANCELED: (OrderPaymentStatus.ON_PAYMENT,),
+}
+
+# Payment statuses by the order statuses of the bank. Other bank statuses mean the payment is still in progress.
+BANK_PAYMENT_STATUSES = {
+    "APPROVED": OrderPaymentStatus.APPROVED,
+    "DECLINED": OrderPaymentStatus.DECLINED,
+    "CANCELED": OrderPaymentStatus.CANCELED,
+    "EXPIRED": OrderPaymentStatus.CANCELED,
+    "REVERSED": OrderPaymentStatus.CANCELED,
+}
+
+# Time after which unpaid card orders are canceled and their stock is released
+UNPAID_ORDER_LIFETIME = timedelta(hours=2)
+
+# Interval of the payment reconciliation run by the worker
+PAYMENT_RECONCILE_INTERVAL = timedelta(minutes=5)
@@ -9,6 +9,8 @@ class OrderFilter(filters.FilterSet):
     id = filters.NumberFilter(field_name="id", lookup_expr="icontains")
     status = filters.NumberFilter(field_name="status", lookup_expr="exact")
     user = filters.CharFilter(field_name="user__phone", lookup_expr="icontains")
+    min_total = filters.NumberFilter(field_name="total", lookup_expr="gte")
+    max_total = filters.NumberFilter(field_name="total", lookup_expr="lte")
 
     class Meta:
         model = Order
@@ -16,4 +18,6 @@ class OrderFilter(filters.FilterSet):
             "id",
             "status",
             "user",
+            "min_total",
+            "max_total",
         )
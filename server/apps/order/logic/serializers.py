@@ -1,15 +1,46 @@
+from django.core.files.storage import default_storage
+from django.db import transaction
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
-from server.apps.order.logic.constants import OrderStatus, PaymentMethod
-from server.apps.order.logic.utils import get_discount, get_payment_redirect_url, send_new_order_email
+from server.apps.order.logic.constants import OrderStatus, PAYMENT_TASK_TIMEOUT, PaymentMethod
+from server.apps.order.logic.utils import (
+    get_cart_quantities,
+    get_discount,
+    get_payment_redirect_url,
+    get_pending_payment,
+    get_product_snapshot,
+    get_stock_errors,
+)
 from server.apps.order.models import Order, OrderItem
-from server.apps.product.logic.serializers import ProductSerializer
+from server.apps.order.tasks import create_payment_task, send_new_order_email_task
+from server.apps.product.models import Product
+from server.apps.task.logic.worker import run_now, wait_for
+
+
+class OrderItemProductSerializer(serializers.Serializer):
+    """Compact serializer for the product snapshot of an order item."""
+
+    slug = serializers.CharField(source="product_slug")
+    code = serializers.CharField(source="product_code")
+    name = serializers.CharField(source="product_name")
+    brand = serializers.CharField(source="brand_name")
+    category = serializers.CharField(source="category_name")
+    thumbnail = serializers.SerializerMethodField()
+
+    @extend_schema_field(serializers.CharField(allow_null=True))
+    def get_thumbnail(self, instance: OrderItem):
+        """Return absolute url of the product image stored with the order item."""
+        if not instance.product_image:
+            return None
+
+        return self.context["request"].build_absolute_uri(default_storage.url(instance.product_image))
 
 
 class OrderItemSerializer(serializers.ModelSerializer):
     """Serializer definition for OrderItem model."""
 
-    product = ProductSerializer()
+    product = OrderItemProductSerializer(source="*", read_only=True)
 
     class Meta:
         """Meta definition for OrderItemSerializer."""
@@ -40,6 +71,9 @@ class OrderSerializer(serializers.ModelSerializer):
             "address",
             "note",
             "status",
+            "subtotal",
+            "discount_total",
+            "total",
             "updated_at",
             "created_at",
         )
@@ -47,6 +81,9 @@ class OrderSerializer(serializers.ModelSerializer):
             "id",
             "items",
             "discount",
+            "subtotal",
+            "discount_total",
+            "total",
             "updated_at",
             "created_at",
         )
@@ -62,58 +99,136 @@ class CheckoutSerializer(serializers.Serializer):
     note = serializers.CharField(write_only=True, required=False)
 
     def validate(self, data: dict):
-        """Validate if cart is not empty."""
+        """
+        Validate if cart is not empty and every product of it is in stock.
+
+        The cart is fetched with its products in a single query and reused by ``create``.
+        """
 
         user = self.context["request"].user
 
-        if user.cart.count() == 0:
+        cart_items = list(user.cart.select_related("product"))
+
+        if not cart_items:
             raise serializers.ValidationError("Səbət boşdur")
 
-        cart_items = user.cart.all()
+        errors = get_stock_errors(
+            get_cart_quantities(cart_items), {item.product_id: item.product for item in cart_items}
+        )
+
+        if errors:
+            raise serializers.ValidationError(errors)
 
-        for item in cart_items:
-            if item.product.quantity < item.quantity:
-                raise serializers.ValidationError(
-                    f'"{item.product.name}" adlı məhsuldan stokda kifayət qədər mövcud deyil'
-                )
+        data["cart_items"] = cart_items
 
         return data
 
-    def create(self, validated_data: dict) -> str:
-        """Create an order for the authenticated user."""
-        user = self.context["request"].user
+    def create(self, validated_data: dict):
+        """
+        Create an order for the authenticated user from the cart.
+
+        Runs in a single transaction: the cart rows and the products are locked while the stock is checked
+        and decremented, so concurrent checkouts can not oversell them or order the same cart twice.
+
+        Card orders return the payment url. When the payment session is not created in time,
+        the committed order is returned with the url to retry the payment at.
+        """
+        request = self.context["request"]
+        user = request.user
 
         code = validated_data.pop("code", None)
 
         installments = validated_data.pop("installments", 0)
 
-        order = Order.objects.create(user=user, **validated_data)
+        cart_ids = [item.pk for item in validated_data.pop("cart_items")]
 
-        main_discount = get_discount(code, order)
+        with transaction.atomic():
+            cart_items = list(user.cart.select_for_update().filter(pk__in=cart_ids).order_by("pk"))
 
-        cart_items = user.cart.all().select_related("product")
+            # A concurrent checkout of the same cart has already ordered and deleted its rows
+            if len(cart_items) != len(cart_ids):
+                raise serializers.ValidationError("Səbət dəyişib, yenidən cəhd edin")
 
-        for item in cart_items:
-            discount = main_discount if item.product.can_do_promo() else item.product.get_discount()
-            order.items.create(
-                product=item.product, price=item.product.price, discount=discount, quantity=item.quantity
+            quantities = get_cart_quantities(cart_items)
+
+            products = (
+                Product.objects.select_for_update(of=("self",))
+                .select_related("brand", "category")
+                .with_thumbnail()
+                .filter(pk__in=quantities)
+                .order_by("pk")
             )
-            item.product.quantity -= item.quantity
-            item.product.save()
-            item.delete()
+            products = {product.pk: product for product in products}
+
+            errors = get_stock_errors(quantities, products)
 
-        send_new_order_email(order)
+            if errors:
+                raise serializers.ValidationError(errors)
+
+            order_status = (
+                OrderStatus.NOT_PAID if validated_data["payment_method"] == PaymentMethod.CARD else OrderStatus.PENDING
+            )
+            order = Order.objects.create(user=user, status=order_status, **validated_data)
+
+            main_discount = get_discount(code, order)
+
+            items = OrderItem.objects.bulk_create(
+                [
+                    OrderItem(
+                        order=order,
+                        price=products[item.product_id].price,
+                        discount=(
+                            main_discount
+                            if products[item.product_id].can_do_promo()
+                            else products[item.product_id].get_discount()
+                        ),
+                        quantity=item.quantity,
+                        **get_product_snapshot(products[item.product_id]),
+                    )
+                    for item in cart_items
+                ]
+            )
+
+            order.set_totals(items)
+            order.save(update_fields=["subtotal", "discount_total", "total"])
+
+            Product.objects.decrease_quantities(quantities)
+
+            user.cart.filter(pk__in=[item.pk for item in cart_items]).delete()
+
+            send_new_order_email_task.apply_async(args=(order.id,), key=f"order:{order.id}:email")
+
+            if order.payment_method == PaymentMethod.CARD:
+                base_url = request.build_absolute_uri().replace("/checkout", "/callback")
+                payment_task = create_payment_task.apply_async(
+                    args=(order.id, base_url, installments), key=f"order:{order.id}:payment"
+                )
 
         if order.payment_method == PaymentMethod.CARD:
-            base_url = self.context["request"].build_absolute_uri().replace("/checkout", "/callback")
-            payment_url = get_payment_redirect_url(base_url, order, installments)
-            return payment_url
+            # A worker may have claimed the task first, then its result is waited for
+            if not run_now(payment_task):
+                wait_for(payment_task, PAYMENT_TASK_TIMEOUT)
+
+            payment = get_pending_payment(order, installments)
+
+            if payment is None:
+                return {
+                    "id": order.id,
+                    "payment_url": request.build_absolute_uri().replace("/checkout", f"/{order.id}/pay"),
+                }
+
+            return payment.url
 
-        order.status = OrderStatus.PENDING
-        order.save()
         return order.id
 
 
+class CheckoutPendingSerializer(serializers.Serializer):
+    """Serializer for the card order whose payment session is not created yet."""
+
+    id = serializers.IntegerField()
+    payment_url = serializers.URLField()
+
+
 class PaymentSerializer(serializers.Serializer):
     """Serializer for payment process."""
 
@@ -0,0 +1,10 @@
+from modeltranslation.translator import register, TranslationOptions
+
+from server.apps.order.models import OrderItem
+
+
+@register(OrderItem)
+class OrderItemTranslationOptions(TranslationOptions):
+    """Translation options for OrderItem model."""
+
+    fields = ("product_name", "brand_name", "category_name")
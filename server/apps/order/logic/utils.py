@@ -1,89 +1,334 @@
-import requests
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
 import xmltodict
 from django.conf import settings
 from django.core.mail import send_mail
-
-from server.apps.order.models import Order
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from server.apps.order.logic.bank import BankGatewayError, get_bank_client
+from server.apps.order.logic.constants import (
+    BANK_PAYMENT_STATUSES,
+    OrderPaymentStatus,
+    OrderStatus,
+    PAYMENT_SESSION_LIFETIME,
+    PAYMENT_STATUS_TRANSITIONS,
+    PaymentMethod,
+    UNPAID_ORDER_LIFETIME,
+)
+from server.apps.order.models import Order, OrderItem, OrderPayment
+from server.apps.product.models import Product
 from server.apps.promo.models import Promo
-from server.settings.components import config
 
+logger = logging.getLogger(__name__)
 
-def get_discount(code: str, order: Order) -> int:
-    """Get discount for user."""
+
+def get_code_discount(code: str, user) -> tuple:
+    """
+    Get discount of the personal or promo code for the user, without recording usage of the promo.
+
+    Return the discount with the promo, which is None unless a valid promo code is given.
+    """
     if not code:
-        return 0
+        return 0, None
 
-    if code == order.user.code:
-        return order.user.discount
+    if code == user.code:
+        return user.discount, None
 
     promo = Promo.objects.filter(code=code).first()
 
-    if not promo or not promo.is_valid() or promo.is_used(order.user):
-        return 0
-
-    promo.usages.create(order=order)
-    return promo.discount
-
-
-def get_xml_request_order(
-    redirect_url: str,
-    amount: int,
-    installments: int = 0,
-    language: str = "AZ",
-) -> dict:
-    """Get XML request for payment order."""
-    data = {
-        "TKKPG": {
-            "Request": {
-                "Operation": "CreateOrder",
-                "Language": language,
-                "Order": {
-                    "OrderType": "Purchase",
-                    "Merchant": config("BANK_MERCHANT"),
-                    "Amount": int(amount * 100),
-                    "Currency": "944",
-                    "Description": f"TAKSIT={installments}" if installments > 0 else "xxxxxxxx",
-                    "ApproveURL": f"{redirect_url}?status=approved",
-                    "CancelURL": f"{redirect_url}?status=canceled",
-                    "DeclineURL": f"{redirect_url}?status=declined",
-                },
-            }
-        }
-    }
+    if not promo or not promo.is_valid() or promo.is_used(user):
+        return 0, None
+
+    return promo.discount, promo
+
+
+def get_discount(code: str, order: Order) -> int:
+    """Get discount for user, recording usage of the promo code by the order."""
+    discount, promo = get_code_discount(code, order.user)
+
+    if promo is not None:
+        promo.usages.create(order=order)
+
+    return discount
+
+
+def get_cart_quantities(cart_items: list) -> dict:
+    """Get total quantities of the cart items per product."""
+    quantities = defaultdict(int)
+
+    for item in cart_items:
+        quantities[item.product_id] += item.quantity
+
+    return quantities
+
+
+def get_stock_errors(quantities: dict, products: dict) -> list:
+    """Get error messages for the products which are deleted or do not have enough stock for the quantities."""
+    errors = []
+
+    for product_id, quantity in quantities.items():
+        product = products.get(product_id)
+
+        if product is None:
+            errors.append("Səbətdəki məhsullardan biri artıq mövcud deyil")
+        elif product.quantity < quantity:
+            errors.append(f'"{product.name}" adlı məhsuldan stokda kifayət qədər mövcud deyil')
+
+    return errors
 
-    xml = xmltodict.unparse(data)
 
-    return xml
+def get_product_snapshot(product: Product) -> dict:
+    """
+    Get fields of an order item copied from the product, so the order history does not depend on the catalog.
+
+    The product is expected to have its brand and category selected and its ``thumbnail`` annotated.
+    """
+    return {
+        "product": product,
+        "product_name_az": product.name_az,
+        "product_name_ru": product.name_ru,
+        "product_code": product.code,
+        "product_slug": product.slug,
+        "product_image": product.thumbnail or "",
+        "brand_name_az": product.brand.name_az,
+        "brand_name_ru": product.brand.name_ru,
+        "category_name_az": product.category.name_az,
+        "category_name_ru": product.category.name_ru,
+    }
 
 
 def send_payment_order(url: str, order: Order, installments: int = 0) -> dict:
     """Send payment order to bank."""
-    xml = get_xml_request_order(url, order.get_total(), installments)
-
-    response = requests.post(
-        config("BANK_URL"),
-        data=xml,
-        cert=(config("BANK_CERT"), config("BANK_KEY")),
-        allow_redirects=True,
-        verify=False,
+    return get_bank_client().create_order(url, order.total, installments)
+
+
+def get_pending_payment(order: Order, installments: int):
+    """Get the pending payment session of the order, which is not expired yet."""
+    return (
+        order.payments.filter(
+            status=OrderPaymentStatus.ON_PAYMENT,
+            installments=installments,
+            created_at__gte=timezone.now() - PAYMENT_SESSION_LIFETIME,
+        )
+        .exclude(url="")
+        .first()
     )
 
-    data = xmltodict.parse(response.text)
 
-    return data["TKKPG"]["Response"]["Order"]
+def get_payment_redirect_url(url: str, order: Order, installments: int) -> str:
+    """
+    Get payment redirect URL.
+
+    The pending payment session of the order is reused, so repeated calls do not create new bank orders.
+    """
+    payment = get_pending_payment(order, installments)
 
+    if payment is not None:
+        return payment.url
 
-def get_payment_redirect_url(url: str, order: Order, installments: int) -> str:
-    """Get payment redirect URL."""
     response = send_payment_order(url, order, installments)
 
-    order.payments.create(
+    payment = order.payments.create(
         bank_session_id=response["SessionID"],
         bank_order_id=response["OrderID"],
         installments=installments,
+        url=f'{response["URL"]}?ORDERID={response["OrderID"]}&SESSIONID={response["SessionID"]}',
     )
 
-    return f'{response["URL"]}?ORDERID={response["OrderID"]}&SESSIONID={response["SessionID"]}'
+    return payment.url
+
+
+def update_payment_status(payment: OrderPayment, status: int) -> bool:
+    """
+    Move the payment to the status reported by the bank, and the order to preparing when the payment is approved.
+
+    Rows are changed with conditional updates, so repeated callbacks never move the statuses backwards.
+    Return True if the payment was changed.
+    """
+    if payment.status not in PAYMENT_STATUS_TRANSITIONS.get(status, ()):
+        return False
+
+    return bool(update_payment_statuses({payment.pk: status}))
+
+
+def update_payment_statuses(statuses: dict) -> int:
+    """
+    Move the payments to the given statuses, locking the ones allowed to move and updating them
+    with one query per status, so repeated callbacks never move the statuses backwards.
+
+    Orders of the approved payments are moved from not paid to preparing, and canceled ones get their stock
+    reserved again. Return number of the changed payments.
+    """
+    now = timezone.now()
+    count = 0
+    approved = []
+
+    with transaction.atomic():
+        for status in set(statuses.values()):
+            changed = list(
+                OrderPayment.objects.select_for_update()
+                .filter(
+                    pk__in=[pk for pk, value in statuses.items() if value == status],
+                    status__in=PAYMENT_STATUS_TRANSITIONS[status],
+                )
+                .values_list("pk", flat=True)
+            )
+            count += OrderPayment.objects.filter(pk__in=changed).update(status=status, updated_at=now)
+
+            if status == OrderPaymentStatus.APPROVED:
+                approved = changed
+
+        if approved:
+            Order.objects.filter(payments__in=approved, status=OrderStatus.NOT_PAID).update(
+                status=OrderStatus.PENDING, updated_at=now
+            )
+
+            reserve_paid_orders(
+                Order.objects.filter(payments__in=approved, status=OrderStatus.CANCELED).values_list("pk", flat=True)
+            )
+
+    return count
+
+
+def reserve_paid_orders(order_ids) -> int:
+    """
+    Reserve stock of the canceled orders again, as their payment has been approved after the stock was released.
+
+    Reserved orders are moved to preparing. Orders whose products are out of stock or deleted by now
+    are marked to be refunded. Return number of the reserved orders.
+    """
+    count = 0
+
+    with transaction.atomic():
+        orders = (
+            Order.objects.select_related(None)
+            .prefetch_related(None)
+            .select_for_update()
+            .filter(pk__in=list(order_ids), status=OrderStatus.CANCELED)
+            .order_by("pk")
+        )
+
+        for order in orders:
+            quantities = defaultdict(int)
+
+            for product_id, quantity in order.items.values_list("product", "quantity"):
+                quantities[product_id] += quantity
+
+            try:
+                if None in quantities:
+                    raise ValueError("Product of the order has been deleted.")
+
+                with transaction.atomic():
+                    Product.objects.decrease_quantities(quantities)
+            except ValueError:
+                logger.error("Order #%s was paid after its stock had been released and has to be refunded.", order.pk)
+                status = OrderStatus.REFUND
+            else:
+                count += 1
+                status = OrderStatus.PENDING
+
+            Order.objects.filter(pk=order.pk).update(status=status, updated_at=timezone.now())
+
+    return count
+
+
+def get_bank_payment_statuses(payments: list, concurrency: int = 5) -> dict:
+    """
+    Get statuses of the payments from the bank, sending the requests in parallel over the shared session.
+
+    Payments still in progress at the bank, or whose status could not be fetched, are left out
+    to be checked again on the next run. They stay pending, as the customer may still complete them.
+    """
+    client = get_bank_client()
+
+    def get_status(payment: OrderPayment):
+        try:
+            bank_status = client.get_order_status(payment.bank_order_id, payment.bank_session_id)
+        except BankGatewayError as error:
+            logger.warning("Could not get status of payment #%s: %s", payment.pk, error)
+            return None
+
+        return BANK_PAYMENT_STATUSES.get(bank_status)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bank") as executor:
+        statuses = list(executor.map(get_status, payments))
+
+    return {payment.pk: status for payment, status in zip(payments, statuses) if status is not None}
+
+
+def release_expired_orders(expire_at) -> int:
+    """
+    Cancel the unpaid card orders created before ``expire_at`` and return their items to stock.
+
+    Orders with a pending or approved payment are kept, as they may still be paid.
+    A payment approved after the release reserves the stock again, see ``reserve_paid_orders``.
+    Return number of the canceled orders.
+    """
+    with transaction.atomic():
+        order_ids = list(
+            Order.objects.select_related(None)
+            .prefetch_related(None)
+            .select_for_update(skip_locked=True)
+            .filter(payment_method=PaymentMethod.CARD, status=OrderStatus.NOT_PAID, created_at__lt=expire_at)
+            .exclude(payments__status__in=(OrderPaymentStatus.ON_PAYMENT, OrderPaymentStatus.APPROVED))
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+
+        if not order_ids:
+            return 0
+
+        Order.objects.filter(pk__in=order_ids).update(status=OrderStatus.CANCELED, updated_at=timezone.now())
+
+        quantities = dict(
+            OrderItem.objects.filter(order__in=order_ids, product__isnull=False)
+            .order_by()
+            .values("product")
+            .annotate(total=Sum("quantity"))
+            .values_list("product", "total")
+        )
+
+        Product.objects.increase_quantities(quantities)
+
+    return len(order_ids)
+
+
+def reconcile_payments(batch_size: int = 100, concurrency: int = 5) -> tuple:
+    """
+    Reconcile the pending payments whose callback has not arrived with the bank, then release the expired orders.
+
+    Statuses of the payments are fetched from the bank in batches, then the unpaid card orders
+    which have expired without a payment in progress are canceled and their stock is released.
+    Return numbers of the checked and updated payments and of the released orders.
+    """
+    now = timezone.now()
+
+    payments = (
+        OrderPayment.objects.filter(
+            status=OrderPaymentStatus.ON_PAYMENT, created_at__lt=now - PAYMENT_SESSION_LIFETIME
+        )
+        .exclude(bank_order_id="")
+        .only("id", "bank_order_id", "bank_session_id")
+        .order_by("pk")
+    )
+
+    checked = updated = 0
+    last_pk = 0
+
+    while batch := list(payments.filter(pk__gt=last_pk)[:batch_size]):
+        statuses = get_bank_payment_statuses(batch, concurrency=concurrency)
+
+        checked += len(batch)
+        updated += update_payment_statuses(statuses)
+        last_pk = batch[-1].pk
+
+    released = release_expired_orders(now - UNPAID_ORDER_LIFETIME)
+
+    return checked, updated, released
 
 
 def format_xml_response(data: str) -> dict:
@@ -115,7 +360,7 @@ def send_new_order_email(order: Order):
 
     for item in order.items.all():
         body += "<tr>"
-        body += f"<td>{item.product.name}</td>"
+        body += f"<td>{item.product_name}</td>"
         body += f"<td>{item.price:.2f} AZN</td>"
         body += f"<td>{item.quantity} ədəd</td>"
         body += f"<td>{item.get_total():.2f} AZN</td>"
@@ -124,7 +369,7 @@ def send_new_order_email(order: Order):
     body += "</table>"
 
     body += "</br>"
-    body += f"\nToplam: {order.get_total()} AZN"
+    body += f"\nToplam: {order.total:.2f} AZN"
     body += "</br>"
     body += f"\nÖdəmə Tipi: {order.get_payment_method_display()}"
     body += "</br></br>"
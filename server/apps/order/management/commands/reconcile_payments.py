@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from server.apps.order.logic.utils import reconcile_payments
+
+
+class Command(BaseCommand):
+    """
+    Reconcile the pending payments whose callback has not arrived, also run by the worker every few minutes.
+
+    Statuses of the payments are fetched from the bank in batches, then the unpaid card orders
+    which have expired without a payment in progress are canceled and their stock is released.
+    """
+
+    help = "Reconcile the pending payments with the bank and release stock of the expired unpaid orders."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="Number of payments checked per batch.")
+        parser.add_argument("--concurrency", type=int, default=5, help="Number of parallel requests to the bank.")
+
+    def handle(self, *args, **options):
+        checked, updated, released = reconcile_payments(options["batch_size"], options["concurrency"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {checked} payment(s), updated {updated} and released stock of {released} expired order(s)."
+            )
+        )
@@ -0,0 +1,155 @@
+import itertools
+import random
+import threading
+import time
+import uuid
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import xmltodict
+from django.core.management.base import BaseCommand
+
+
+class FakeBank:
+    """In-memory state of the fake TKKPG bank gateway."""
+
+    def __init__(self, base_url: str, status: str, delay: float, failure_rate: float):
+        self.base_url = base_url
+        self.status = status
+        self.delay = delay
+        self.failure_rate = failure_rate
+
+        self.orders = {}
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def create_order(self, request: dict) -> dict:
+        """Store the order and return its payment page."""
+        order_id = str(next(self.ids))
+        session_id = uuid.uuid4().hex.upper()
+
+        with self.lock:
+            self.orders[order_id] = {"session_id": session_id, "status": "CREATED", **request["Order"]}
+
+        return {"OrderID": order_id, "SessionID": session_id, "URL": f"{self.base_url}/pay"}
+
+    def get_order_status(self, request: dict) -> dict:
+        """Return the status of the order."""
+        order = self.orders.get(request["Order"]["OrderID"])
+
+        if order is None:
+            return None
+
+        return {"OrderID": request["Order"]["OrderID"], "OrderStatus": order["status"]}
+
+    def pay(self, order_id: str) -> tuple:
+        """Complete the payment of the order and return the URL to redirect to with its message."""
+        order = self.orders[order_id]
+        order["status"] = self.status
+
+        message = {"Message": {"OrderID": order_id, "OrderStatus": self.status}}
+
+        if self.status == "APPROVED":
+            return order["ApproveURL"], {"XMLOut": message}
+
+        if self.status == "DECLINED":
+            return order["DeclineURL"], {"XMLOut": message}
+
+        return order["CancelURL"], message
+
+
+class FakeBankHandler(BaseHTTPRequestHandler):
+    """Request handler of the fake TKKPG bank gateway."""
+
+    bank: FakeBank = None
+
+    def do_POST(self):
+        """Handle the ``CreateOrder`` and ``GetOrderStatus`` XML requests."""
+        time.sleep(self.bank.delay)
+
+        if random.random() < self.bank.failure_rate:
+            return self.send_body(503, "text/plain", "Service Unavailable")
+
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        request = xmltodict.parse(body)["TKKPG"]["Request"]
+        operation = request["Operation"]
+
+        if operation == "CreateOrder":
+            result = self.bank.create_order(request)
+        elif operation == "GetOrderStatus":
+            result = self.bank.get_order_status(request)
+        else:
+            result = None
+
+        response = {"Operation": operation, "Status": "00" if result else "30"}
+
+        if result:
+            response["Order"] = result
+
+        self.send_body(200, "application/xml", xmltodict.unparse({"TKKPG": {"Response": response}}))
+
+    def do_GET(self):
+        """Serve the payment page, which posts the payment result to the callback of the shop."""
+        query = parse_qs(urlparse(self.path).query)
+        order_id = query.get("ORDERID", [""])[0]
+
+        if order_id not in self.bank.orders:
+            return self.send_body(404, "text/plain", "Order not found")
+
+        url, message = self.bank.pay(order_id)
+
+        html = (
+            f'<form method="post" action="{escape(url)}">'
+            f'<input type="hidden" name="xmlmsg" value="{escape(xmltodict.unparse(message))}">'
+            "</form><script>document.forms[0].submit()</script>"
+        )
+
+        self.send_body(200, "text/html", html)
+
+    def send_body(self, status: int, content_type: str, body: str):
+        """Send the response with the body."""
+        data = body.encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class Command(BaseCommand):
+    """Run a fake TKKPG bank gateway, so payment flows can be run and load tested offline."""
+
+    help = "Run a fake TKKPG bank gateway. Point BANK_URL to it, e.g. BANK_URL=http://127.0.0.1:8090/"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8090)
+        parser.add_argument(
+            "--status",
+            default="APPROVED",
+            choices=("APPROVED", "DECLINED", "CANCELED"),
+            help="Result of the payments.",
+        )
+        parser.add_argument("--delay", type=float, default=0, help="Seconds to wait before every response.")
+        parser.add_argument("--failure-rate", type=float, default=0, help="Share of the requests failing with 503.")
+
+    def handle(self, *args, **options):
+        FakeBankHandler.bank = FakeBank(
+            base_url=f"http://{options['host']}:{options['port']}",
+            status=options["status"],
+            delay=options["delay"],
+            failure_rate=options["failure_rate"],
+        )
+
+        server = ThreadingHTTPServer((options["host"], options["port"]), FakeBankHandler)
+
+        self.stdout.write(self.style.SUCCESS(f"Fake bank is running at http://{options['host']}:{options['port']}/"))
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
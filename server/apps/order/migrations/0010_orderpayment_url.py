@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0009_created_at_id_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orderpayment",
+            name="url",
+            field=models.URLField(blank=True, max_length=1024, verbose_name="URL"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0010_orderpayment_url"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="orderpayment",
+            name="bank_order_id",
+            field=models.CharField(blank=True, db_index=True, max_length=255, verbose_name="Bank Order ID"),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:09
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def populate_totals(apps, schema_editor):
+    """Set subtotal, discount total and total of the existing orders from their items, in batches."""
+    Order = apps.get_model("order", "Order")
+
+    orders = Order.objects.only("id").prefetch_related("items")
+    fields = ["subtotal", "discount_total", "total"]
+    batch = []
+
+    for order in orders.order_by("pk").iterator(chunk_size=BATCH_SIZE):
+        order.subtotal = Decimal(0)
+        order.total = Decimal(0)
+
+        for item in order.items.all():
+            order.subtotal += item.price * item.quantity
+            order.total += (item.price * (100 - item.discount) / 100).quantize(
+                Decimal("0.01"), ROUND_HALF_UP
+            ) * item.quantity
+
+        order.discount_total = order.subtotal - order.total
+        batch.append(order)
+
+        if len(batch) >= BATCH_SIZE:
+            Order.objects.bulk_update(batch, fields)
+            batch = []
+
+    if batch:
+        Order.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0011_orderpayment_bank_order_id_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="discount_total",
+            field=models.DecimalField(
+                decimal_places=2, default=0, editable=False, max_digits=10, verbose_name="Discount Total"
+            ),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="subtotal",
+            field=models.DecimalField(
+                decimal_places=2, default=0, editable=False, max_digits=10, verbose_name="Subtotal"
+            ),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="total",
+            field=models.DecimalField(
+                db_index=True, decimal_places=2, default=0, editable=False, max_digits=10, verbose_name="Total"
+            ),
+        ),
+        migrations.RunPython(populate_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,120 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 500
+
+
+def populate_product_snapshot(apps, schema_editor):
+    """Copy name, code, slug, image and brand name of the products to the existing order items, in batches."""
+    OrderItem = apps.get_model("order", "OrderItem")
+    ProductImage = apps.get_model("product", "ProductImage")
+
+    images = ProductImage.objects.filter(product=OuterRef("product")).order_by("position", "created_at")
+    items = (
+        OrderItem.objects.filter(product__isnull=False)
+        .select_related("product__brand")
+        .annotate(thumbnail=Subquery(images.values("image")[:1]))
+    )
+    fields = [
+        "product_name",
+        "product_name_az",
+        "product_name_ru",
+        "product_code",
+        "product_slug",
+        "product_image",
+        "brand_name",
+        "brand_name_az",
+        "brand_name_ru",
+    ]
+    batch = []
+
+    for item in items.order_by("pk").iterator(chunk_size=BATCH_SIZE):
+        item.product_name = item.product.name
+        item.product_name_az = item.product.name_az
+        item.product_name_ru = item.product.name_ru
+        item.product_code = item.product.code
+        item.product_slug = item.product.slug
+        item.product_image = item.thumbnail or ""
+        item.brand_name = item.product.brand.name
+        item.brand_name_az = item.product.brand.name_az
+        item.brand_name_ru = item.product.brand.name_ru
+        batch.append(item)
+
+        if len(batch) >= BATCH_SIZE:
+            OrderItem.objects.bulk_update(batch, fields)
+            batch = []
+
+    if batch:
+        OrderItem.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0012_order_totals"),
+        ("product", "0014_product_final_price"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orderitem",
+            name="brand_name",
+            field=models.CharField(blank=True, max_length=255, verbose_name="Brand Name"),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="brand_name_az",
+            field=models.CharField(blank=True, max_length=255, null=True, verbose_name="Brand Name"),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="brand_name_ru",
+            field=models.CharField(blank=True, max_length=255, null=True, verbose_name="Brand Name"),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="product_code",
+            field=models.CharField(blank=True, max_length=255, verbose_name="Product Code"),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="product_image",
+            field=models.CharField(blank=True, max_length=255, verbose_name="Product Image"),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="product_name",
+            field=models.CharField(blank=True, max_length=255, verbose_name="Product Name"),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="product_name_az",
+            field=models.CharField(blank=True, max_length=255, null=True, verbose_name="Product Name"),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="product_name_ru",
+            field=models.CharField(blank=True, max_length=255, null=True, verbose_name="Product Name"),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="product_slug",
+            field=models.SlugField(blank=True, max_length=255, verbose_name="Product Slug"),
+        ),
+        migrations.AlterField(
+            model_name="orderitem",
+            name="product",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="orders",
+                to="product.product",
+                verbose_name="Product",
+            ),
+        ),
+        migrations.RunPython(populate_product_snapshot, migrations.RunPython.noop),
+    ]
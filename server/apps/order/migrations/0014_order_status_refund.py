@@ -0,0 +1,29 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0013_orderitem_product_snapshot"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="order",
+            name="status",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (0, "Ödənilməyib"),
+                    (1, "Hazırlanır"),
+                    (2, "Yoldadır"),
+                    (3, "Çatdırıldı"),
+                    (4, "Ləğv edildi"),
+                    (5, "Geri ödənilməlidir"),
+                ],
+                default=0,
+                verbose_name="Status",
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:39
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def populate_category_name(apps, schema_editor):
+    """Copy category name of the products to the existing order items in batches."""
+    OrderItem = apps.get_model("order", "OrderItem")
+
+    items = (
+        OrderItem.objects.filter(product__isnull=False)
+        .select_related("product__category")
+        .only("product__category__name", "product__category__name_az", "product__category__name_ru")
+        .order_by("pk")
+    )
+    fields = ["category_name", "category_name_az", "category_name_ru"]
+    batch = []
+
+    for item in items.iterator(chunk_size=BATCH_SIZE):
+        category = item.product.category
+
+        item.category_name = category.name
+        item.category_name_az = category.name_az
+        item.category_name_ru = category.name_ru
+
+        batch.append(item)
+
+        if len(batch) >= BATCH_SIZE:
+            OrderItem.objects.bulk_update(batch, fields)
+            batch = []
+
+    if batch:
+        OrderItem.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0014_order_status_refund"),
+        ("category", "0006_alter_category_options_alter_category_managers_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orderitem",
+            name="category_name",
+            field=models.CharField(blank=True, max_length=255, verbose_name="Category Name"),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="category_name_az",
+            field=models.CharField(blank=True, max_length=255, null=True, verbose_name="Category Name"),
+        ),
+        migrations.AddField(
+            model_name="orderitem",
+            name="category_name_ru",
+            field=models.CharField(blank=True, max_length=255, null=True, verbose_name="Category Name"),
+        ),
+        migrations.RunPython(populate_category_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:41
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def recompute_totals(apps, schema_editor):
+    """Recompute totals of the orders with the item prices rounded half up, as checkout rounds them."""
+    Order = apps.get_model("order", "Order")
+
+    orders = Order.objects.only("subtotal", "discount_total", "total").prefetch_related("items")
+    fields = ["subtotal", "discount_total", "total"]
+    batch = []
+
+    for order in orders.order_by("pk").iterator(chunk_size=BATCH_SIZE):
+        subtotal = Decimal(0)
+        total = Decimal(0)
+
+        for item in order.items.all():
+            subtotal += item.price * item.quantity
+            total += (item.price * (100 - item.discount) / 100).quantize(
+                Decimal("0.01"), ROUND_HALF_UP
+            ) * item.quantity
+
+        if (order.subtotal, order.total) == (subtotal, total):
+            continue
+
+        order.subtotal = subtotal
+        order.total = total
+        order.discount_total = subtotal - total
+        batch.append(order)
+
+        if len(batch) >= BATCH_SIZE:
+            Order.objects.bulk_update(batch, fields)
+            batch = []
+
+    if batch:
+        Order.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("order", "0015_orderitem_category_name"),
+    ]
+
+    operations = [
+        migrations.RunPython(recompute_totals, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,5 @@
+from decimal import Decimal, ROUND_HALF_UP
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -20,6 +22,16 @@ class Order(TimeStampedModel):
         verbose_name=_("Status"), choices=OrderStatus.choices, default=OrderStatus.NOT_PAID
     )
 
+    subtotal = models.DecimalField(
+        verbose_name=_("Subtotal"), max_digits=10, decimal_places=2, default=0, editable=False
+    )
+    discount_total = models.DecimalField(
+        verbose_name=_("Discount Total"), max_digits=10, decimal_places=2, default=0, editable=False
+    )
+    total = models.DecimalField(
+        verbose_name=_("Total"), max_digits=10, decimal_places=2, default=0, editable=False, db_index=True
+    )
+
     objects = OrderManager()
 
     class Meta:
@@ -28,13 +40,17 @@ class Order(TimeStampedModel):
 
         ordering = ("-created_at",)
 
+        indexes = (models.Index(fields=("-created_at", "-id"), name="order_created_at_id_idx"),)
+
     def __str__(self):
         """Unicode representation of Order."""
         return f'{_("Order")} #{self.id}'
 
-    def get_total(self):
-        """Get total price of the order."""
-        return sum([item.get_total() for item in self.items.all()])
+    def set_totals(self, items: list):
+        """Set subtotal, discount total and total of the order from its items."""
+        self.subtotal = sum((item.get_subtotal() for item in items), Decimal(0))
+        self.total = sum((item.get_total() for item in items), Decimal(0))
+        self.discount_total = self.subtotal - self.total
 
 
 class OrderItem(TimeStampedModel):
@@ -43,8 +59,21 @@ class OrderItem(TimeStampedModel):
     order = models.ForeignKey(Order, verbose_name=_("Order"), on_delete=models.CASCADE, related_name="items")
 
     product = models.ForeignKey(
-        "product.Product", verbose_name=_("Product"), on_delete=models.CASCADE, related_name="orders"
+        "product.Product",
+        verbose_name=_("Product"),
+        on_delete=models.SET_NULL,
+        related_name="orders",
+        null=True,
+        blank=True,
     )
+
+    # Snapshot of the product at checkout, so the order history does not depend on the catalog
+    product_name = models.CharField(verbose_name=_("Product Name"), max_length=255, blank=True)
+    product_code = models.CharField(verbose_name=_("Product Code"), max_length=255, blank=True)
+    product_slug = models.SlugField(verbose_name=_("Product Slug"), max_length=255, blank=True)
+    product_image = models.CharField(verbose_name=_("Product Image"), max_length=255, blank=True)
+    brand_name = models.CharField(verbose_name=_("Brand Name"), max_length=255, blank=True)
+    category_name = models.CharField(verbose_name=_("Category Name"), max_length=255, blank=True)
     price = models.DecimalField(verbose_name=_("Price"), max_digits=10, decimal_places=2, default=0.00)
     discount = models.PositiveSmallIntegerField(verbose_name=_("Discount"), default=0)
 
@@ -58,11 +87,17 @@ class OrderItem(TimeStampedModel):
 
     def __str__(self):
         """Unicode representation of OrderItem."""
-        return f'{_("Order")} #{self.id} - {self.product.name}'
+        return f'{_("Order")} #{self.id} - {self.product_name}'
+
+    def get_subtotal(self):
+        """Get total price of the item before the discount."""
+        return Decimal(self.price) * self.quantity
 
     def get_total(self):
-        """Get total price of the item."""
-        return float(self.price) * (1 - self.discount / 100) * self.quantity
+        """Get total price of the item after the discount."""
+        return (Decimal(self.price) * (100 - self.discount) / 100).quantize(
+            Decimal("0.01"), ROUND_HALF_UP
+        ) * self.quantity
 
 
 class OrderPayment(TimeStampedModel):
@@ -71,8 +106,9 @@ class OrderPayment(TimeStampedModel):
     order = models.ForeignKey(Order, verbose_name=_("Order"), on_delete=models.CASCADE, related_name="payments")
 
     bank_session_id = models.CharField(verbose_name=_("Bank Session ID"), max_length=255, blank=True)
-    bank_order_id = models.CharField(verbose_name=_("Bank Order ID"), max_length=255, blank=True)
+    bank_order_id = models.CharField(verbose_name=_("Bank Order ID"), max_length=255, blank=True, db_index=True)
     installments = models.PositiveSmallIntegerField(verbose_name=_("Installments"), default=1)
+    url = models.URLField(verbose_name=_("URL"), max_length=1024, blank=True)
     status = models.PositiveSmallIntegerField(
         verbose_name=_("Status"), choices=OrderPaymentStatus.choices, default=OrderPaymentStatus.ON_PAYMENT
     )
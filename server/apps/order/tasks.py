@@ -0,0 +1,48 @@
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.utils import timezone
+
+from server.apps.order.logic.constants import OrderStatus, PAYMENT_RECONCILE_INTERVAL
+from server.apps.order.logic.utils import get_payment_redirect_url, reconcile_payments, send_new_order_email
+from server.apps.order.models import Order
+from server.apps.task.logic.utils import task
+from server.apps.task.models import Task
+
+
+@task
+def send_new_order_email_task(order_id: int):
+    """Send email notification to the admin about the new order."""
+    send_new_order_email(Order.objects.get(pk=order_id))
+
+
+@task
+def create_payment_task(order_id: int, url: str, installments: int):
+    """Create bank payment session of the unpaid order, unless a pending one already exists."""
+    order = Order.objects.get(pk=order_id)
+
+    if order.status == OrderStatus.NOT_PAID:
+        get_payment_redirect_url(url, order, installments)
+
+
+@task
+def reconcile_payments_task():
+    """Reconcile the pending payments with the bank, and schedule the run of the next interval."""
+    try:
+        reconcile_payments()
+    finally:
+        schedule_reconcile_payments(intervals=1)
+
+
+def schedule_reconcile_payments(intervals: int = 0) -> Task:
+    """
+    Enqueue reconciliation of the payments at the start of the interval, ``intervals`` after the current one.
+
+    The task is keyed by the start of the interval, so every interval is enqueued and run once,
+    however many times it is scheduled.
+    """
+    seconds = PAYMENT_RECONCILE_INTERVAL.total_seconds()
+    start = timezone.now().timestamp() // seconds * seconds + intervals * seconds
+    run_at = datetime.fromtimestamp(start, tz=dt_timezone.utc)
+
+    return reconcile_payments_task.apply_async(key=f"order:reconcile-payments:{run_at.isoformat()}", run_at=run_at)
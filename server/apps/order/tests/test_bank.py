@@ -0,0 +1,56 @@
+import pytest
+import requests
+
+from server.apps.order.logic.bank import BankGatewayClient, BankGatewayError, cast_verify, CircuitBreaker
+
+
+def get_client(monkeypatch: pytest.MonkeyPatch, text: str) -> BankGatewayClient:
+    """Returns client of a bank answering every request with the text."""
+    client = BankGatewayClient(
+        url="https://bank.test/",
+        merchant="E1000010",
+        circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60),
+    )
+
+    def post(*args, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = text.encode()
+        return response
+
+    monkeypatch.setattr(client.session, "post", post)
+
+    return client
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "<html>Bad Gateway",
+        "<TKKPG><Error/></TKKPG>",
+        "<TKKPG><Response>text</Response></TKKPG>",
+        "<TKKPG><Response><Status>00</Status></Response></TKKPG>",
+    ],
+)
+def test_malformed_response_is_gateway_failure(monkeypatch: pytest.MonkeyPatch, text: str) -> None:
+    client = get_client(monkeypatch, text)
+
+    with pytest.raises(BankGatewayError):
+        client.get_order_status("1", "session")
+
+    assert not client.circuit_breaker.allow()
+
+
+def test_order_status_is_returned(monkeypatch: pytest.MonkeyPatch) -> None:
+    text = "<TKKPG><Response><Status>00</Status><Order><OrderStatus>APPROVED</OrderStatus></Order></Response></TKKPG>"
+    client = get_client(monkeypatch, text)
+
+    assert client.get_order_status("1", "session") == "APPROVED"
+    assert client.circuit_breaker.allow()
+
+
+def test_verify_setting_accepts_ca_bundle_path() -> None:
+    assert cast_verify("True") is True
+    assert cast_verify("false") is False
+    assert cast_verify("config/bank-ca.pem") == "config/bank-ca.pem"
+    assert BankGatewayClient(url="https://bank.test/", merchant="E1000010").session.verify is True
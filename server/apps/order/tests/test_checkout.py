@@ -0,0 +1,140 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection, connections
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from server.apps.account.models import Cart
+from server.apps.order.logic.constants import PaymentMethod
+from server.apps.order.logic.serializers import CheckoutSerializer
+from server.apps.order.logic.utils import get_stock_errors
+from server.apps.order.models import Order
+from server.apps.product.models import Product
+from server.apps.user.models import User
+
+CUSTOMERS = 8
+STOCK = 3
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Row locks need PostgreSQL")
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_checkouts_do_not_oversell(create_product) -> None:
+    """Customers checking out the last items at once never push the stock below zero."""
+    product = create_product(quantity=STOCK)
+    users = [User.objects.create_user(phone=f"50000000{index}", password="password") for index in range(CUSTOMERS)]
+    Cart.objects.bulk_create([Cart(user=user, product=product, quantity=1) for user in users])
+
+    barrier = Barrier(CUSTOMERS)
+
+    def checkout(user: User) -> int:
+        client = APIClient()
+        client.force_authenticate(user)
+        barrier.wait()
+
+        try:
+            response = client.post(
+                "/api/v1/orders/checkout/", {"payment_method": PaymentMethod.CASH, "address": "Bakı"}
+            )
+        finally:
+            connections.close_all()
+
+        return response.status_code
+
+    with ThreadPoolExecutor(max_workers=CUSTOMERS) as executor:
+        status_codes = list(executor.map(checkout, users))
+
+    product.refresh_from_db()
+
+    assert sorted(status_codes) == [200] * STOCK + [400] * (CUSTOMERS - STOCK)
+    assert product.quantity == 0
+    assert Order.objects.count() == STOCK
+
+
+@pytest.mark.django_db
+def test_card_checkout_returns_order_when_payment_session_is_not_ready(
+    api_client: APIClient, user: User, create_product, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Card order stays committed and gets a retry url when a worker has claimed its payment task."""
+    monkeypatch.setattr("server.apps.order.logic.serializers.run_now", lambda task: False)
+    product = create_product()
+    Cart.objects.create(user=user, product=product, quantity=2)
+    api_client.force_authenticate(user)
+
+    response = api_client.post("/api/v1/orders/checkout/", {"payment_method": PaymentMethod.CARD, "address": "Bakı"})
+
+    order = Order.objects.get()
+    assert response.status_code == 202
+    assert response.data == {
+        "id": order.id,
+        "payment_url": f"http://testserver/api/v1/orders/{order.id}/pay/",
+    }
+    assert order.payments.count() == 0
+
+
+@pytest.mark.django_db
+def test_order_items_keep_product_snapshot(api_client: APIClient, user: User, create_product) -> None:
+    """Order items are rendered from the snapshot taken at checkout, including the category name."""
+    product = create_product()
+    Cart.objects.create(user=user, product=product, quantity=1)
+    api_client.force_authenticate(user)
+
+    order_id = api_client.post("/api/v1/orders/checkout/", {"payment_method": PaymentMethod.CASH}).data
+    product.delete()
+
+    response = api_client.get(f"/api/v1/orders/{order_id}/")
+
+    assert response.status_code == 200
+    assert {key: value for key, value in response.data["items"][0]["product"].items() if key != "thumbnail"} == {
+        "slug": product.slug,
+        "code": "P0",
+        "name": "Məhsul 0",
+        "brand": "Brend",
+        "category": "Kateqoriya",
+    }
+
+
+def get_checkout_serializer(user: User) -> CheckoutSerializer:
+    """Returns validated checkout serializer of the cash order of the user."""
+    serializer = CheckoutSerializer(
+        data={"payment_method": PaymentMethod.CASH}, context={"request": SimpleNamespace(user=user)}
+    )
+    serializer.is_valid(raise_exception=True)
+    return serializer
+
+
+@pytest.mark.django_db
+def test_double_submitted_checkout_orders_cart_once(user: User, create_product) -> None:
+    """Second of two checkouts validated with the same cart fails instead of ordering it again."""
+    product = create_product(quantity=10)
+    Cart.objects.create(user=user, product=product, quantity=2)
+
+    first, second = get_checkout_serializer(user), get_checkout_serializer(user)
+    first.save()
+
+    with pytest.raises(ValidationError):
+        second.save()
+
+    product.refresh_from_db()
+    assert product.quantity == 8
+    assert Order.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_checkout_of_deleted_product_is_validation_error(user: User, create_product) -> None:
+    product = create_product()
+    Cart.objects.create(user=user, product=product, quantity=1)
+    serializer = get_checkout_serializer(user)
+
+    Product.objects.filter(pk=product.pk).delete()
+
+    with pytest.raises(ValidationError):
+        serializer.save()
+
+    assert not Order.objects.exists()
+
+
+def test_stock_errors_of_deleted_product() -> None:
+    assert get_stock_errors({1: 1}, {}) == ["Səbətdəki məhsullardan biri artıq mövcud deyil"]
@@ -0,0 +1,144 @@
+import threading
+from datetime import timedelta
+from http.server import ThreadingHTTPServer
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from server.apps.order.logic.bank import BankGatewayClient
+from server.apps.order.logic.constants import (
+    OrderPaymentStatus,
+    OrderStatus,
+    PAYMENT_RECONCILE_INTERVAL,
+    PaymentMethod,
+)
+from server.apps.order.logic.utils import update_payment_status
+from server.apps.order.management.commands.runfakebank import FakeBank, FakeBankHandler
+from server.apps.order.models import Order, OrderItem, OrderPayment
+from server.apps.product.models import Product
+from server.apps.task.logic.constants import TaskStatus
+from server.apps.task.logic.worker import Worker
+from server.apps.task.models import Task
+from server.apps.user.models import User
+
+
+@pytest.fixture
+def fake_bank(monkeypatch: pytest.MonkeyPatch) -> FakeBank:
+    """Runs the fake bank gateway in a thread and points the bank client of the orders to it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeBankHandler)
+    url = f"http://127.0.0.1:{server.server_port}"
+    bank = FakeBank(base_url=url, status="APPROVED", delay=0, failure_rate=0)
+    monkeypatch.setattr(FakeBankHandler, "bank", bank)
+
+    client = BankGatewayClient(url=f"{url}/", merchant="E1000010")
+    monkeypatch.setattr("server.apps.order.logic.utils.get_bank_client", lambda: client)
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield bank
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def create_order(user: User, fake_bank: FakeBank, create_product):
+    """Returns factory of unpaid card orders of a product, with a bank payment created hours ago."""
+
+    def factory(index: int = 0, quantity: int = 2) -> tuple:
+        product = create_product(index, quantity=10)
+        Product.objects.filter(pk=product.pk).update(quantity=10 - quantity)
+
+        order = Order.objects.create(user=user, payment_method=PaymentMethod.CARD, status=OrderStatus.NOT_PAID)
+        OrderItem.objects.create(order=order, product=product, price=product.price, quantity=quantity)
+
+        bank_order = fake_bank.create_order({"Order": {"ApproveURL": "", "CancelURL": "", "DeclineURL": ""}})
+        payment = order.payments.create(bank_order_id=bank_order["OrderID"], bank_session_id=bank_order["SessionID"])
+
+        created_at = timezone.now() - timedelta(hours=3)
+        Order.objects.filter(pk=order.pk).update(created_at=created_at)
+        OrderPayment.objects.filter(pk=payment.pk).update(created_at=created_at)
+
+        return order, payment, product
+
+    return factory
+
+
+def get_state(order: Order, payment: OrderPayment, product: Product) -> tuple:
+    """Returns current statuses of the order and the payment with stock of the product."""
+    return (
+        Order.objects.get(pk=order.pk).status,
+        OrderPayment.objects.get(pk=payment.pk).status,
+        Product.objects.get(pk=product.pk).quantity,
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reconcile_keeps_payment_in_progress_at_bank(fake_bank: FakeBank, create_order) -> None:
+    """Expired order keeps its stock while the customer may still complete the payment at the bank."""
+    order, payment, product = create_order()
+
+    call_command("reconcile_payments")
+
+    assert get_state(order, payment, product) == (OrderStatus.NOT_PAID, OrderPaymentStatus.ON_PAYMENT, 8)
+
+    fake_bank.pay(payment.bank_order_id)
+    call_command("reconcile_payments")
+
+    assert get_state(order, payment, product) == (OrderStatus.PENDING, OrderPaymentStatus.APPROVED, 8)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reconcile_releases_stock_of_expired_payment(fake_bank: FakeBank, create_order) -> None:
+    order, payment, product = create_order()
+    fake_bank.orders[payment.bank_order_id]["status"] = "EXPIRED"
+
+    call_command("reconcile_payments")
+
+    assert get_state(order, payment, product) == (OrderStatus.CANCELED, OrderPaymentStatus.CANCELED, 10)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_payment_approved_after_release_reserves_stock(fake_bank: FakeBank, create_order) -> None:
+    """Payment approved after the stock was released reserves it again, or marks the order to be refunded."""
+    order, payment, product = create_order()
+    sold_out_order, sold_out_payment, sold_out_product = create_order(1)
+
+    for bank_order_id in (payment.bank_order_id, sold_out_payment.bank_order_id):
+        fake_bank.orders[bank_order_id]["status"] = "EXPIRED"
+
+    call_command("reconcile_payments")
+    Product.objects.filter(pk=sold_out_product.pk).update(quantity=1)
+
+    assert update_payment_status(OrderPayment.objects.get(pk=payment.pk), OrderPaymentStatus.APPROVED)
+    assert update_payment_status(OrderPayment.objects.get(pk=sold_out_payment.pk), OrderPaymentStatus.APPROVED)
+
+    assert get_state(order, payment, product) == (OrderStatus.PENDING, OrderPaymentStatus.APPROVED, 8)
+    assert get_state(sold_out_order, sold_out_payment, sold_out_product) == (
+        OrderStatus.REFUND,
+        OrderPaymentStatus.APPROVED,
+        1,
+    )
+
+    # Repeated callback does not reserve the stock twice
+    assert not update_payment_status(OrderPayment.objects.get(pk=payment.pk), OrderPaymentStatus.APPROVED)
+    assert get_state(order, payment, product) == (OrderStatus.PENDING, OrderPaymentStatus.APPROVED, 8)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_reconciles_payments_every_interval(fake_bank: FakeBank, create_order) -> None:
+    """Starting worker reconciles the payments of the current interval and schedules the next interval."""
+    order, payment, product = create_order()
+    fake_bank.pay(payment.bank_order_id)
+
+    Worker(concurrency=1).run(once=True)
+
+    assert get_state(order, payment, product) == (OrderStatus.PENDING, OrderPaymentStatus.APPROVED, 8)
+
+    tasks = Task.objects.filter(key__startswith="order:reconcile-payments:").order_by("run_at")
+    assert list(tasks.values_list("status", flat=True)) == [TaskStatus.SUCCEEDED, TaskStatus.PENDING]
+
+    first, second = tasks
+    assert second.run_at - first.run_at == PAYMENT_RECONCILE_INTERVAL
@@ -2,13 +2,19 @@ from django.views.generic import RedirectView
 from drf_spectacular.utils import extend_schema
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 
 from server.apps.core.logic import responses
-from server.apps.order.logic.constants import OrderPaymentStatus, OrderStatus
+from server.apps.order.logic.constants import OrderPaymentStatus
 from server.apps.order.logic.filters import OrderFilter
-from server.apps.order.logic.serializers import CheckoutSerializer, OrderSerializer, PaymentSerializer
-from server.apps.order.logic.utils import format_xml_response
+from server.apps.order.logic.serializers import (
+    CheckoutPendingSerializer,
+    CheckoutSerializer,
+    OrderSerializer,
+    PaymentSerializer,
+)
+from server.apps.order.logic.utils import format_xml_response, update_payment_status
 from server.apps.order.models import Order, OrderPayment
 
 
@@ -41,9 +47,14 @@ class OrderViewSet(viewsets.ModelViewSet):
         return Order.objects.filter(user=self.request.user)
 
     @extend_schema(
-        description="Checkout the cart.",
+        description=(
+            "Checkout the cart. Returns the payment url of card orders and the id of the others. "
+            "When the payment session of a card order can not be created yet, responds with 202 and "
+            "the id of the created order with the url to retry its payment at."
+        ),
         responses={
             status.HTTP_200_OK: str,
+            status.HTTP_202_ACCEPTED: CheckoutPendingSerializer,
             status.HTTP_401_UNAUTHORIZED: responses.UNAUTHORIZED,
             status.HTTP_403_FORBIDDEN: responses.FORBIDDEN,
         },
@@ -55,6 +66,9 @@ class OrderViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         data = serializer.save()
 
+        if isinstance(data, dict):
+            return Response(data, status=status.HTTP_202_ACCEPTED)
+
         return Response(data, status=status.HTTP_200_OK)
 
     @extend_schema(
@@ -85,6 +99,7 @@ class OrderViewSet(viewsets.ModelViewSet):
             status.HTTP_200_OK: str,
             status.HTTP_401_UNAUTHORIZED: responses.UNAUTHORIZED,
             status.HTTP_403_FORBIDDEN: responses.FORBIDDEN,
+            status.HTTP_404_NOT_FOUND: responses.NOT_FOUND,
         },
     )
     @action(detail=False, methods=["post"], url_path="callback", permission_classes=[permissions.AllowAny])
@@ -95,16 +110,23 @@ class OrderViewSet(viewsets.ModelViewSet):
         if request.query_params.get("status") in ["approved", "declined"]:
             response = response["XMLOut"]
 
-        payment = OrderPayment.objects.filter(bank_order_id=response["Message"]["OrderID"]).first()
-        payment.status = OrderPaymentStatus[response["Message"]["OrderStatus"]]
-        payment.save()
+        message = response["Message"]
+
+        payment = (
+            OrderPayment.objects.select_related("order")
+            .only("id", "status", "order__id")
+            .filter(bank_order_id=message["OrderID"])
+            .first()
+        )
+
+        if payment is None:
+            raise NotFound
 
-        if payment.status == OrderPaymentStatus.APPROVED:
-            payment.order.status = OrderStatus.PENDING
-            payment.order.save()
+        if message["OrderStatus"] in OrderPaymentStatus.names:
+            update_payment_status(payment, OrderPaymentStatus[message["OrderStatus"]])
 
         return RedirectView.as_view(
-            url=f'https://dentalshop.az/account/orders/{payment.order.id}?status={response["Message"]["OrderStatus"]}'
+            url=f'https://dentalshop.az/account/orders/{payment.order.id}?status={message["OrderStatus"]}'
         )(request)
 
     @extend_schema(
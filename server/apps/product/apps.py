@@ -6,3 +6,7 @@ class ProductConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "server.apps.product"
     verbose_name = _("Product")
+
+    def ready(self):
+        """Connect signal receivers."""
+        import server.apps.product.signals  # noqa: F401
@@ -0,0 +1,9 @@
+# Price ranges of the price facet, as (min, max) pairs with exclusive max
+PRICE_BUCKETS = (
+    (0, 10),
+    (10, 25),
+    (25, 50),
+    (50, 100),
+    (100, 250),
+    (250, None),
+)
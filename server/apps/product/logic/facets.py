@@ -0,0 +1,82 @@
+from django.db.models import Count, Max, Min, Q, QuerySet
+
+from server.apps.brand.models import Brand
+from server.apps.category.models import Category
+from server.apps.product.logic.constants import PRICE_BUCKETS
+
+
+def get_brand_facets(queryset: QuerySet) -> list:
+    """Get product counts per brand, ordered by count."""
+    counts = dict(queryset.values_list("brand_id").annotate(count=Count("id")).order_by())
+    brands = Brand.objects.filter(id__in=counts).only("id", "slug", "name")
+
+    return sorted(
+        ({"slug": brand.slug, "name": brand.name, "count": counts[brand.id]} for brand in brands),
+        key=lambda facet: (-facet["count"], facet["name"]),
+    )
+
+
+def get_category_facets(queryset: QuerySet) -> list:
+    """
+    Get product counts per category, in tree order.
+
+    Counts are rolled up along the tree, so every category counts the products of its descendants too.
+    """
+    counts = dict(queryset.values_list("category_id").annotate(count=Count("id")).order_by())
+
+    if not counts:
+        return []
+
+    categories = {
+        category.id: category
+        for category in Category.objects.only("id", "slug", "name", "parent_id", "tree_id", "lft", "rght")
+    }
+    totals = dict.fromkeys(categories, 0)
+
+    for category_id, count in counts.items():
+        while category_id is not None and category_id in categories:
+            totals[category_id] += count
+            category_id = categories[category_id].parent_id
+
+    return [
+        {
+            "slug": category.slug,
+            "name": category.name,
+            "parent": categories[category.parent_id].slug if category.parent_id in categories else None,
+            "count": totals[category.id],
+        }
+        for category in categories.values()
+        if totals[category.id]
+    ]
+
+
+def get_price_facets(queryset: QuerySet) -> dict:
+    """Get price range of the products and product counts per price bucket, with a single aggregate query."""
+    aggregates = {
+        f"bucket_{index}": Count(
+            "id",
+            filter=Q(final_price__gte=lower) & (Q(final_price__lt=upper) if upper is not None else Q()),
+        )
+        for index, (lower, upper) in enumerate(PRICE_BUCKETS)
+    }
+    result = queryset.aggregate(min=Min("final_price"), max=Max("final_price"), **aggregates)
+
+    return {
+        "min": result["min"],
+        "max": result["max"],
+        "buckets": [
+            {"min": lower, "max": upper, "count": result[f"bucket_{index}"]}
+            for index, (lower, upper) in enumerate(PRICE_BUCKETS)
+        ],
+    }
+
+
+def get_product_facets(queryset: QuerySet) -> dict:
+    """Get brand, category and price facets of the products."""
+    queryset = queryset.order_by()
+
+    return {
+        "brands": get_brand_facets(queryset),
+        "categories": get_category_facets(queryset),
+        "price": get_price_facets(queryset),
+    }
@@ -1,4 +1,3 @@
-from django.utils import timezone
 from django_filters import rest_framework as filters
 
 from server.apps.product.models import Product
@@ -7,6 +6,8 @@ from server.apps.product.models import Product
 class ProductFilter(filters.FilterSet):
     """Filter for Product model."""
 
+    search = filters.CharFilter(method="filter_search")
+
     name = filters.CharFilter(field_name="name", lookup_expr="icontains")
     code = filters.CharFilter(field_name="code", lookup_expr="icontains")
 
@@ -16,8 +17,8 @@ class ProductFilter(filters.FilterSet):
     category_name = filters.CharFilter(field_name="category__name", lookup_expr="icontains")
     brand_name = filters.CharFilter(field_name="brand__name", lookup_expr="icontains")
 
-    min_price = filters.NumberFilter(field_name="price", lookup_expr="gte")
-    max_price = filters.NumberFilter(field_name="price", lookup_expr="lte")
+    min_price = filters.NumberFilter(field_name="final_price", lookup_expr="gte")
+    max_price = filters.NumberFilter(field_name="final_price", lookup_expr="lte")
     discount = filters.BooleanFilter(field_name="discount", method="filter_discount")
 
     is_new = filters.BooleanFilter(field_name="is_new")
@@ -28,6 +29,7 @@ class ProductFilter(filters.FilterSet):
     class Meta:
         model = Product
         fields = [
+            "search",
             "name",
             "code",
             "category",
@@ -46,10 +48,15 @@ class ProductFilter(filters.FilterSet):
         """Filter if product has discount and end date is not passed."""
 
         if value:
-            return queryset.filter(discount__gt=0).filter(discount_end_date__gte=timezone.now())
+            return queryset.filter(effective_discount__gt=0)
 
         return queryset
 
+    def filter_search(self, queryset, name, value):
+        """Full-text search ordered by rank."""
+
+        return queryset.search(value)
+
     def filter_category(self, queryset, name, value):
         """Filter by category slug."""
 
@@ -1,4 +1,19 @@
-from django.db.models import Q, QuerySet
+from functools import partial
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db import connections, transaction
+from django.db.models import Case, F, OuterRef, PositiveIntegerField, Q, QuerySet, Subquery, When
+from django.utils import timezone
+
+from server.apps.category.models import Category
+from server.apps.core.logic.caching import bump_version
+from server.apps.product.logic.search import (
+    get_search_parts,
+    get_search_terms,
+    get_search_vector,
+    normalize_search_text,
+    SEARCH_CONFIG,
+)
 
 
 class ProductQuerySet(QuerySet):
@@ -16,12 +31,167 @@ class ProductQuerySet(QuerySet):
         )
 
     def filter_category(self, value):
-        """Filter by category slug and its parents."""
+        """Filter by category slug and all of its descendants."""
+        category = Category.objects.filter(slug__iexact=value).only("tree_id", "lft", "rght").first()
+
+        if category is None:
+            return self.none()
+
+        return self.filter(
+            category__tree_id=category.tree_id,
+            category__lft__gte=category.lft,
+            category__lft__lte=category.rght,
+        )
+
+    def expire_discounts(self):
+        """
+        Reset selling price of the products whose discount has ended, with a single UPDATE query.
+
+        ``update()`` skips the ``post_save`` signals, so cached responses are invalidated here.
+        """
+        count = self.filter(
+            effective_discount__gt=0, discount_end_date__lt=timezone.localtime(timezone.now()).date()
+        ).update(effective_discount=0, final_price=F("price"))
+
+        if count:
+            transaction.on_commit(partial(bump_version, self.model._meta.label))
+
+        return count
+
+    def decrease_quantities(self, quantities: dict):
+        """
+        Decrease stock of the products by the given quantities with a single conditional UPDATE query.
+
+        Raises ``ValueError`` if any of the products does not have enough stock,
+        so the surrounding transaction is rolled back.
+        """
+        condition = Q()
+        cases = []
+
+        for product_id, quantity in quantities.items():
+            condition |= Q(pk=product_id, quantity__gte=quantity)
+            cases.append(When(pk=product_id, then=F("quantity") - quantity))
+
+        if not cases:
+            return 0
+
+        count = self.filter(condition).update(
+            quantity=Case(*cases, default=F("quantity"), output_field=PositiveIntegerField())
+        )
+
+        if count != len(quantities):
+            raise ValueError("Not enough stock to decrease the product quantities.")
+
+        transaction.on_commit(partial(bump_version, self.model._meta.label))
+
+        return count
+
+    def increase_quantities(self, quantities: dict):
+        """Return the given quantities to stock of the products with a single UPDATE query."""
+        cases = [When(pk=product_id, then=F("quantity") + quantity) for product_id, quantity in quantities.items()]
+
+        if not cases:
+            return 0
+
+        count = self.filter(pk__in=quantities).update(
+            quantity=Case(*cases, default=F("quantity"), output_field=PositiveIntegerField())
+        )
+
+        transaction.on_commit(partial(bump_version, self.model._meta.label))
+
+        return count
 
-        result = self.filter(
-            Q(category__slug__iexact=value)
-            | Q(category__parent__slug__iexact=value)
-            | Q(category__parent__parent__slug__iexact=value)
+    def is_postgres(self):
+        """Check if the queryset runs against PostgreSQL."""
+        return connections[self.db].vendor == "postgresql"
+
+    def update_search_index(self, batch_size: int = 500):
+        """
+        Rebuild the normalized search document and search vector of the products.
+
+        Texts are normalized in Python and written back with one ``bulk_update`` query per batch.
+        Only PostgreSQL maintains the search vector.
+        """
+        fields = ["search_document", "search_vector"] if self.is_postgres() else ["search_document"]
+        products = self.select_related("brand", "category").only(
+            "code",
+            "name_az",
+            "name_ru",
+            "brand__name_az",
+            "brand__name_ru",
+            "category__name_az",
+            "category__name_ru",
+        )
+
+        batch = []
+        count = 0
+
+        for product in products.order_by().iterator(chunk_size=batch_size):
+            parts = get_search_parts(product)
+
+            product.search_document = " ".join(filter(None, parts))
+
+            if "search_vector" in fields:
+                product.search_vector = get_search_vector(parts)
+
+            batch.append(product)
+
+            if len(batch) >= batch_size:
+                count += self.model.objects.bulk_update(batch, fields)
+                batch = []
+
+        if batch:
+            count += self.model.objects.bulk_update(batch, fields)
+
+        return count
+
+    def search(self, value):
+        """
+        Full-text search by name, code, brand name and category name, ordered by rank.
+
+        The query is normalized the same way as the search document and every term matches as a prefix.
+        Falls back to ``contains`` lookups on the search document on other databases.
+        """
+        terms = get_search_terms(value)
+
+        if not terms:
+            return self
+
+        if not self.is_postgres():
+            return self.filter(*(Q(search_document__contains=term) for term in terms))
+
+        query = SearchQuery(" & ".join(f"{term}:*" for term in terms), search_type="raw", config=SEARCH_CONFIG)
+
+        return (
+            self.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", "-created_at")
         )
 
-        return result
+    def with_thumbnail(self):
+        """Annotate path of the first image of the product as ``thumbnail``."""
+        images = self.model._meta.get_field("images").related_model.objects.filter(product=OuterRef("pk"))
+
+        return self.annotate(thumbnail=Subquery(images.values("image")[:1]))
+
+    def suggest(self, value):
+        """
+        Typo-tolerant lookup for autocomplete, ordered by similarity.
+
+        The query is normalized the same way as the search document and matched against it
+        with trigram word similarity backed by the ``gin_trgm_ops`` index.
+        Falls back to ``contains`` lookups on the search document on other databases.
+        """
+        value = normalize_search_text(value)
+
+        if not value:
+            return self.none()
+
+        if not self.is_postgres():
+            return self.filter(search_document__contains=value)
+
+        return (
+            self.filter(search_document__trigram_word_similar=value)
+            .annotate(similarity=TrigramWordSimilarity(value, "search_document"))
+            .order_by("-similarity", "-created_at")
+        )
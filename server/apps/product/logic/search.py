@@ -0,0 +1,125 @@
+import re
+
+from django.contrib.postgres.search import SearchVector
+from django.db.models import Value
+
+SEARCH_CONFIG = "simple"
+
+# Product fields the search index is built from
+SEARCH_INDEXED_FIELDS = frozenset(
+    ("code", "name", "name_az", "name_ru", "brand", "brand_id", "category", "category_id")
+)
+
+AZERBAIJANI_LETTERS = {
+    "ə": "e",
+    "ş": "s",
+    "ç": "c",
+    "ğ": "g",
+    "ı": "i",
+    "ö": "o",
+    "ü": "u",
+}
+
+CYRILLIC_LETTERS = {
+    "а": "a",
+    "б": "b",
+    "в": "v",
+    "г": "g",
+    "д": "d",
+    "е": "e",
+    "ё": "e",
+    "ж": "zh",
+    "з": "z",
+    "и": "i",
+    "й": "y",
+    "к": "k",
+    "л": "l",
+    "м": "m",
+    "н": "n",
+    "о": "o",
+    "п": "p",
+    "р": "r",
+    "с": "s",
+    "т": "t",
+    "у": "u",
+    "ф": "f",
+    "х": "kh",
+    "ц": "ts",
+    "ч": "ch",
+    "ш": "sh",
+    "щ": "shch",
+    "ъ": "",
+    "ы": "y",
+    "ь": "",
+    "э": "e",
+    "ю": "yu",
+    "я": "ya",
+    # Azerbaijani Cyrillic
+    "ә": "e",
+    "ғ": "g",
+    "ҹ": "c",
+    "ҝ": "g",
+    "һ": "h",
+    "ө": "o",
+    "ү": "u",
+    "ј": "y",
+}
+
+SEARCH_TRANSLATION = str.maketrans({**AZERBAIJANI_LETTERS, **CYRILLIC_LETTERS})
+
+NON_WORD_REGEX = re.compile(r"[\W_]+")
+
+
+def normalize_search_text(value: str | None) -> str:
+    """
+    Normalize text for search.
+
+    Text is lowercased, Azerbaijani letters are folded to Latin, Cyrillic is transliterated to Latin
+    and punctuation is replaced with spaces.
+    """
+    if not value:
+        return ""
+
+    # "İ" is lowercased to "i" followed by a combining dot above
+    value = value.replace("İ", "i").lower().replace("\u0307", "").translate(SEARCH_TRANSLATION)
+
+    return NON_WORD_REGEX.sub(" ", value).strip()
+
+
+def normalize_code(value: str | None) -> str:
+    """Normalize product code for search, dropping punctuation and spaces altogether."""
+    return normalize_search_text(value).replace(" ", "")
+
+
+def get_search_terms(value: str | None) -> list:
+    """Split normalized search query into terms."""
+    return normalize_search_text(value).split()
+
+
+def join_search_texts(*values) -> str:
+    """Normalize the values and join the non-empty ones."""
+    return " ".join(filter(None, map(normalize_search_text, values)))
+
+
+def get_search_parts(product) -> tuple:
+    """
+    Get normalized search texts of the product, ordered by weight.
+
+    Code and names come first, followed by the brand names and the category names.
+    """
+    return (
+        join_search_texts(product.code, normalize_code(product.code), product.name_az, product.name_ru),
+        join_search_texts(product.brand.name_az, product.brand.name_ru),
+        join_search_texts(product.category.name_az, product.category.name_ru),
+    )
+
+
+def get_search_vector(parts: tuple):
+    """Build weighted search vector expression from the normalized search texts."""
+    primary, brand, category = parts
+
+    return (
+        SearchVector(Value(primary), weight="A", config=SEARCH_CONFIG)
+        + SearchVector(Value(brand), weight="B", config=SEARCH_CONFIG)
+        + SearchVector(Value(category), weight="C", config=SEARCH_CONFIG)
+    )
@@ -1,6 +1,8 @@
+from django.core.files.storage import default_storage
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
+from server.apps.account.logic.utils import get_favorite_ids
 from server.apps.brand.logic.serializers import BrandSerializer
 from server.apps.category.logic.serializers import CategorySerializer
 from server.apps.core.logic.fields import MultipleImageField
@@ -39,6 +41,7 @@ class ProductSerializer(serializers.ModelSerializer):
             "price",
             "discount",
             "discount_end_date",
+            "final_price",
             "quantity",
             "is_promo",
             "is_new",
@@ -51,6 +54,7 @@ class ProductSerializer(serializers.ModelSerializer):
         )
         read_only_fields = (
             "slug",
+            "final_price",
             "created_at",
             "updated_at",
         )
@@ -68,6 +72,73 @@ class ProductSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(serializers.BooleanField)
     def get_is_favorite(self, instance: Product):
-        """Return True if the product is favorited by the authenticated user."""
-        user = self.context["request"].user
-        return instance.favorites.filter(user=user).exists()
+        """
+        Return True if the product is favorited by the authenticated user.
+
+        The flag can be given in the context when it is already known, e.g. for the favorite products.
+        """
+        if "is_favorite" in self.context:
+            return self.context["is_favorite"]
+
+        return instance.id in get_favorite_ids(self.context["request"])
+
+
+class ProductSuggestSerializer(serializers.ModelSerializer):
+    """Lightweight serializer for Product autocomplete suggestions."""
+
+    thumbnail = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Product
+        fields = (
+            "slug",
+            "code",
+            "name",
+            "thumbnail",
+        )
+
+    @extend_schema_field(serializers.CharField(allow_null=True))
+    def get_thumbnail(self, instance: Product):
+        """Return absolute url of the first image of the product."""
+        if not instance.thumbnail:
+            return None
+
+        return self.context["request"].build_absolute_uri(default_storage.url(instance.thumbnail))
+
+
+class FacetSerializer(serializers.Serializer):
+    """Serializer for a facet value with its product count."""
+
+    slug = serializers.CharField()
+    name = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class CategoryFacetSerializer(FacetSerializer):
+    """Serializer for a category facet value with its product count."""
+
+    parent = serializers.CharField(allow_null=True)
+
+
+class PriceBucketSerializer(serializers.Serializer):
+    """Serializer for a price range with its product count."""
+
+    min = serializers.DecimalField(max_digits=10, decimal_places=2)
+    max = serializers.DecimalField(max_digits=10, decimal_places=2, allow_null=True)
+    count = serializers.IntegerField()
+
+
+class PriceFacetSerializer(serializers.Serializer):
+    """Serializer for the price facet."""
+
+    min = serializers.DecimalField(max_digits=10, decimal_places=2, allow_null=True)
+    max = serializers.DecimalField(max_digits=10, decimal_places=2, allow_null=True)
+    buckets = PriceBucketSerializer(many=True)
+
+
+class ProductFacetsSerializer(serializers.Serializer):
+    """Serializer for brand, category and price facets of products."""
+
+    brands = FacetSerializer(many=True)
+    categories = CategoryFacetSerializer(many=True)
+    price = PriceFacetSerializer()
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from server.apps.product.models import Product
+
+
+class Command(BaseCommand):
+    """Reset selling price of the products whose discount has ended, also run by the worker daily after midnight."""
+
+    help = "Reset selling price of the products whose discount has ended."
+
+    def handle(self, *args, **options):
+        count = Product.objects.expire_discounts()
+
+        self.stdout.write(self.style.SUCCESS(f"Expired discounts of {count} product(s)."))
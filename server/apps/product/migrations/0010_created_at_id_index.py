@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-18 11:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("brand", "0004_alter_brand_created_at_alter_brand_slug_and_more"),
+        ("category", "0006_alter_category_options_alter_category_managers_and_more"),
+        ("product", "0009_alter_productimage_options_alter_productnote_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(fields=["-created_at", "-id"], name="product_created_at_id_idx"),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.0.14 on 2026-10-18 11:51
+
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def create_search_vector_index(apps, schema_editor):
+    """Create GIN index on the search vector, PostgreSQL only."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS product_search_vector_idx ON product_product USING gin (search_vector)"
+    )
+
+
+def drop_search_vector_index(apps, schema_editor):
+    """Drop GIN index on the search vector, PostgreSQL only."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS product_search_vector_idx")
+
+
+def populate_search_vector(apps, schema_editor):
+    """Build search vectors of the existing products."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    Product = apps.get_model("product", "Product")
+    Brand = apps.get_model("brand", "Brand")
+    Category = apps.get_model("category", "Category")
+
+    brand = Brand.objects.filter(pk=OuterRef("brand_id"))
+    category = Category.objects.filter(pk=OuterRef("category_id"))
+
+    Product.objects.update(
+        search_vector=(
+            SearchVector("code", "name_az", "name_ru", weight="A", config="simple")
+            + SearchVector(
+                Subquery(brand.values("name_az")[:1]),
+                Subquery(brand.values("name_ru")[:1]),
+                weight="B",
+                config="simple",
+            )
+            + SearchVector(
+                Subquery(category.values("name_az")[:1]),
+                Subquery(category.values("name_ru")[:1]),
+                weight="C",
+                config="simple",
+            )
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("brand", "0004_alter_brand_created_at_alter_brand_slug_and_more"),
+        ("category", "0006_alter_category_options_alter_category_managers_and_more"),
+        ("product", "0010_created_at_id_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Search Vector"
+            ),
+        ),
+        migrations.RunPython(create_search_vector_index, drop_search_vector_index),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+    ]
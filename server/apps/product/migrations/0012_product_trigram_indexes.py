@@ -0,0 +1,42 @@
+# Generated by Django 5.0.14 on 2026-10-18 11:53
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+TRIGRAM_INDEXES = {
+    "product_code_trgm_idx": "code",
+    "product_name_az_trgm_idx": "name_az",
+    "product_name_ru_trgm_idx": "name_ru",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create GIN trigram indexes on the code and names, PostgreSQL only."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON product_product USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Drop GIN trigram indexes on the code and names, PostgreSQL only."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0011_product_search_vector"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,165 @@
+# Generated by Django 5.0.14 on 2026-10-18 11:55
+
+import re
+
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import Value
+
+# Frozen copy of the search normalization at the time of this migration,
+# so later changes of the app code do not alter or break it.
+
+SEARCH_CONFIG = "simple"
+
+AZERBAIJANI_LETTERS = {
+    "ə": "e",
+    "ş": "s",
+    "ç": "c",
+    "ğ": "g",
+    "ı": "i",
+    "ö": "o",
+    "ü": "u",
+}
+
+CYRILLIC_LETTERS = {
+    "а": "a",
+    "б": "b",
+    "в": "v",
+    "г": "g",
+    "д": "d",
+    "е": "e",
+    "ё": "e",
+    "ж": "zh",
+    "з": "z",
+    "и": "i",
+    "й": "y",
+    "к": "k",
+    "л": "l",
+    "м": "m",
+    "н": "n",
+    "о": "o",
+    "п": "p",
+    "р": "r",
+    "с": "s",
+    "т": "t",
+    "у": "u",
+    "ф": "f",
+    "х": "kh",
+    "ц": "ts",
+    "ч": "ch",
+    "ш": "sh",
+    "щ": "shch",
+    "ъ": "",
+    "ы": "y",
+    "ь": "",
+    "э": "e",
+    "ю": "yu",
+    "я": "ya",
+    # Azerbaijani Cyrillic
+    "ә": "e",
+    "ғ": "g",
+    "ҹ": "c",
+    "ҝ": "g",
+    "һ": "h",
+    "ө": "o",
+    "ү": "u",
+    "ј": "y",
+}
+
+SEARCH_TRANSLATION = str.maketrans({**AZERBAIJANI_LETTERS, **CYRILLIC_LETTERS})
+
+NON_WORD_REGEX = re.compile(r"[\W_]+")
+
+BATCH_SIZE = 500
+
+
+def normalize_search_text(value):
+    """Lowercase, fold Azerbaijani letters, transliterate Cyrillic and replace punctuation with spaces."""
+    if not value:
+        return ""
+
+    value = value.replace("İ", "i").lower().replace("\u0307", "").translate(SEARCH_TRANSLATION)
+
+    return NON_WORD_REGEX.sub(" ", value).strip()
+
+
+def join_search_texts(*values):
+    """Normalize the values and join the non-empty ones."""
+    return " ".join(filter(None, map(normalize_search_text, values)))
+
+
+def get_search_parts(product):
+    """Get normalized code and names, brand names and category names of the product."""
+    return (
+        join_search_texts(
+            product.code,
+            normalize_search_text(product.code).replace(" ", ""),
+            product.name_az,
+            product.name_ru,
+        ),
+        join_search_texts(product.brand.name_az, product.brand.name_ru),
+        join_search_texts(product.category.name_az, product.category.name_ru),
+    )
+
+
+def get_search_vector(parts):
+    """Build weighted search vector expression from the normalized search texts."""
+    primary, brand, category = parts
+
+    return (
+        SearchVector(Value(primary), weight="A", config=SEARCH_CONFIG)
+        + SearchVector(Value(brand), weight="B", config=SEARCH_CONFIG)
+        + SearchVector(Value(category), weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def populate_search_index(apps, schema_editor):
+    """Build normalized search documents and search vectors of the existing products in batches."""
+    Product = apps.get_model("product", "Product")
+
+    is_postgres = schema_editor.connection.vendor == "postgresql"
+    fields = ["search_document", "search_vector"] if is_postgres else ["search_document"]
+
+    products = Product.objects.select_related("brand", "category").only(
+        "code",
+        "name_az",
+        "name_ru",
+        "brand__name_az",
+        "brand__name_ru",
+        "category__name_az",
+        "category__name_ru",
+    )
+    batch = []
+
+    for product in products.order_by("pk").iterator(chunk_size=BATCH_SIZE):
+        parts = get_search_parts(product)
+
+        product.search_document = " ".join(filter(None, parts))
+
+        if is_postgres:
+            product.search_vector = get_search_vector(parts)
+
+        batch.append(product)
+
+        if len(batch) >= BATCH_SIZE:
+            Product.objects.bulk_update(batch, fields)
+            batch = []
+
+    if batch:
+        Product.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0012_product_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False, verbose_name="Search Document"),
+        ),
+        migrations.RunPython(populate_search_index, migrations.RunPython.noop),
+    ]
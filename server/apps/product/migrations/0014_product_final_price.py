@@ -0,0 +1,59 @@
+# Generated by Django 5.0.14 on 2026-10-18 11:56
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import migrations, models
+from django.utils import timezone
+
+BATCH_SIZE = 500
+
+
+def populate_final_price(apps, schema_editor):
+    """Set effective discount and final price of the existing products, in batches."""
+    Product = apps.get_model("product", "Product")
+
+    today = timezone.localtime(timezone.now()).date()
+    products = Product.objects.only("price", "discount", "discount_end_date")
+    fields = ["effective_discount", "final_price"]
+    batch = []
+
+    for product in products.order_by("pk").iterator(chunk_size=BATCH_SIZE):
+        expired = product.discount_end_date and product.discount_end_date < today
+
+        product.effective_discount = 0 if expired else product.discount
+        product.final_price = (product.price * (100 - product.effective_discount) / 100).quantize(
+            Decimal("0.01"), ROUND_HALF_UP
+        )
+        batch.append(product)
+
+        if len(batch) >= BATCH_SIZE:
+            Product.objects.bulk_update(batch, fields)
+            batch = []
+
+    if batch:
+        Product.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0013_product_search_document"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="effective_discount",
+            field=models.PositiveIntegerField(
+                db_index=True, default=0, editable=False, verbose_name="Effective Discount"
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="final_price",
+            field=models.DecimalField(
+                db_index=True, decimal_places=2, default=0, editable=False, max_digits=10, verbose_name="Final Price"
+            ),
+        ),
+        migrations.RunPython(populate_final_price, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.0.14 on 2026-10-18 14:02
+
+from django.db import migrations
+
+RAW_TRIGRAM_INDEXES = {
+    "product_code_trgm_idx": "code",
+    "product_name_az_trgm_idx": "name_az",
+    "product_name_ru_trgm_idx": "name_ru",
+}
+
+
+def create_search_document_trigram_index(apps, schema_editor):
+    """
+    Index the normalized search document for suggestions, PostgreSQL only.
+
+    Suggestions no longer match the raw code and names, so their indexes are dropped.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS product_search_document_trgm_idx "
+        "ON product_product USING gin (search_document gin_trgm_ops)"
+    )
+
+    for name in RAW_TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def drop_search_document_trigram_index(apps, schema_editor):
+    """Restore the trigram indexes on the raw code and names, PostgreSQL only."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name, column in RAW_TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON product_product USING gin ({column} gin_trgm_ops)"
+        )
+
+    schema_editor.execute("DROP INDEX IF EXISTS product_search_document_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0014_product_final_price"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_document_trigram_index, drop_search_document_trigram_index),
+    ]
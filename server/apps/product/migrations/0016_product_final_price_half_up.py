@@ -0,0 +1,44 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:41
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import migrations
+
+BATCH_SIZE = 500
+
+
+def recompute_final_price(apps, schema_editor):
+    """Recompute final price of the products rounded half up, as checkout and the cart summary round it."""
+    Product = apps.get_model("product", "Product")
+
+    products = Product.objects.filter(effective_discount__gt=0).only("price", "effective_discount", "final_price")
+    batch = []
+
+    for product in products.order_by("pk").iterator(chunk_size=BATCH_SIZE):
+        final_price = (product.price * (100 - product.effective_discount) / 100).quantize(
+            Decimal("0.01"), ROUND_HALF_UP
+        )
+
+        if product.final_price == final_price:
+            continue
+
+        product.final_price = final_price
+        batch.append(product)
+
+        if len(batch) >= BATCH_SIZE:
+            Product.objects.bulk_update(batch, ["final_price"])
+            batch = []
+
+    if batch:
+        Product.objects.bulk_update(batch, ["final_price"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0015_product_search_document_trigram_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(recompute_final_price, migrations.RunPython.noop),
+    ]
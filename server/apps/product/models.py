@@ -1,3 +1,6 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 from django.utils.text import slugify
@@ -5,6 +8,7 @@ from django.utils.translation import gettext_lazy as _
 
 from server.apps.core.models import ChildImageModel, SlugModel, SortableModel
 from server.apps.product.logic.queryset import ProductQuerySet
+from server.apps.product.logic.search import SEARCH_INDEXED_FIELDS
 
 
 class Product(SlugModel):
@@ -25,6 +29,13 @@ class Product(SlugModel):
 
     discount_end_date = models.DateField(verbose_name=_("Discount End Date"), null=True, blank=True)
 
+    effective_discount = models.PositiveIntegerField(
+        verbose_name=_("Effective Discount"), default=0, db_index=True, editable=False
+    )
+    final_price = models.DecimalField(
+        verbose_name=_("Final Price"), max_digits=10, decimal_places=2, default=0, db_index=True, editable=False
+    )
+
     quantity = models.PositiveIntegerField(verbose_name=_("Quantity"), default=0)
 
     is_promo = models.BooleanField(verbose_name=_("Is Promo"), default=True)
@@ -35,6 +46,9 @@ class Product(SlugModel):
     main_note = models.TextField(verbose_name=_("Main Note"), blank=True, null=True)
     description = models.TextField(verbose_name=_("Description"))
 
+    search_document = models.TextField(verbose_name=_("Search Document"), blank=True, default="", editable=False)
+    search_vector = SearchVectorField(verbose_name=_("Search Vector"), null=True, editable=False)
+
     objects = ProductQuerySet.as_manager()
 
     class Meta:
@@ -43,10 +57,32 @@ class Product(SlugModel):
 
         ordering = ("-created_at",)
 
+        indexes = (models.Index(fields=("-created_at", "-id"), name="product_created_at_id_idx"),)
+
     def __str__(self):
         """Unicode representation of Product."""
         return self.name
 
+    def save(self, *args, **kwargs):
+        """
+        Save the product with its current selling price and rebuild its search index.
+
+        The index is not rebuilt when only fields it is not built from are updated.
+        """
+        self.effective_discount = self.get_discount()
+        self.final_price = self.get_final_price()
+
+        update_fields = kwargs.get("update_fields")
+
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            kwargs["update_fields"] = {*update_fields, "effective_discount", "final_price"}
+
+        super().save(*args, **kwargs)
+
+        if update_fields is None or SEARCH_INDEXED_FIELDS.intersection(update_fields):
+            Product.objects.filter(pk=self.pk).update_search_index()
+
     def generate_slug(self):
         return slugify(f"{self.name}-{self.code}")
 
@@ -60,6 +96,10 @@ class Product(SlugModel):
 
         return self.discount
 
+    def get_final_price(self):
+        """Get price of the product after the discount."""
+        return (Decimal(self.price) * (100 - self.get_discount()) / 100).quantize(Decimal("0.01"), ROUND_HALF_UP)
+
     def can_do_promo(self):
         """Check if product can do promo."""
         return self.is_promo and self.get_discount() == 0
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from server.apps.product.models import Product
+
+
+@receiver(post_save, sender="brand.Brand", dispatch_uid="brand_post_save_search_index")
+def update_brand_products_search_index(sender, instance, **kwargs):
+    """Rebuild search index of the brand products, as it includes the brand name."""
+    Product.objects.filter(brand=instance).update_search_index()
+
+
+@receiver(post_save, sender="category.Category", dispatch_uid="category_post_save_search_index")
+def update_category_products_search_index(sender, instance, **kwargs):
+    """Rebuild search index of the category products, as it includes the category name."""
+    Product.objects.filter(category=instance).update_search_index()
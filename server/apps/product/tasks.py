@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from server.apps.product.models import Product
+from server.apps.task.logic.utils import task
+from server.apps.task.models import Task
+
+
+@task
+def expire_discounts_task():
+    """Reset selling price of the products whose discount has ended, and schedule the run of the next day."""
+    try:
+        Product.objects.expire_discounts()
+    finally:
+        schedule_expire_discounts(days=1)
+
+
+def schedule_expire_discounts(days: int = 0) -> Task:
+    """
+    Enqueue expiry of the ended discounts at the start of the day, ``days`` after today.
+
+    The task is keyed by the date, so every day is enqueued and run once, however many times it is scheduled.
+    """
+    run_at = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=days)
+
+    return expire_discounts_task.apply_async(key=f"product:expire-discounts:{run_at.date()}", run_at=run_at)
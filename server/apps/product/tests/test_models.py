@@ -0,0 +1,23 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from server.apps.product.models import Product
+
+
+@pytest.mark.django_db
+def test_save_rebuilds_search_index_only_for_indexed_fields(create_product) -> None:
+    """Saving fields the search index is not built from skips its rebuild."""
+    product = create_product(name_az="Şampun")
+
+    product.quantity = 5
+
+    with CaptureQueriesContext(connection) as queries:
+        product.save(update_fields=["quantity"])
+
+    assert len(queries) == 1
+
+    product.name_az = "Sabun"
+    product.save(update_fields=["name_az"])
+
+    assert "sabun" in Product.objects.values_list("search_document", flat=True).get(pk=product.pk)
@@ -0,0 +1,135 @@
+import os
+from time import perf_counter
+
+import pytest
+from django.db.models import Q
+
+from server.apps.brand.models import Brand
+from server.apps.category.models import Category
+from server.apps.product.models import Product
+
+# Number of products of the opt-in benchmark, e.g. BENCHMARK_PRODUCTS=50000 pytest
+BENCHMARK_PRODUCTS = int(os.environ.get("BENCHMARK_PRODUCTS", 0))
+
+
+def create_categories(parents: list, count: int, prefix: str) -> list:
+    """Bulk create ``count`` children for each of the parents, or roots when no parents are given."""
+    categories = [
+        Category(
+            name=f"{prefix}-{index}",
+            slug=f"{prefix}-{index}",
+            parent=parent,
+            lft=0,
+            rght=0,
+            tree_id=0,
+            level=0,
+        )
+        for index, parent in enumerate(parent for parent in parents for _ in range(count))
+    ]
+    return Category.objects.bulk_create(categories)
+
+
+def seed_catalog(brand: Brand, sizes: tuple, products: int) -> list:
+    """
+    Seed a category tree with the given number of children per level, and the products spread over it.
+
+    Return the categories grouped by level, without their tree fields rebuilt at the end.
+    """
+    levels = [create_categories([None], sizes[0], "level-0")]
+
+    for depth, size in enumerate(sizes[1:], start=1):
+        levels.append(create_categories(levels[-1], size, f"level-{depth}"))
+
+    Category.objects.rebuild()
+
+    categories = [category for level in levels for category in level]
+    Product.objects.bulk_create(
+        (
+            Product(
+                code=f"B{index}",
+                slug=f"b{index}",
+                name=f"Product {index}",
+                description="Description",
+                brand=brand,
+                category=categories[index % len(categories)],
+                price=10,
+                final_price=10,
+                quantity=10,
+            )
+            for index in range(products)
+        ),
+        batch_size=1000,
+    )
+
+    return levels
+
+
+def filter_category_by_joins(value: str):
+    """Former category filter, matching the category, its parent or its grandparent by slug."""
+    return Product.objects.filter(
+        Q(category__slug__iexact=value)
+        | Q(category__parent__slug__iexact=value)
+        | Q(category__parent__parent__slug__iexact=value)
+    )
+
+
+def get_ids(queryset) -> set:
+    return set(queryset.values_list("id", flat=True))
+
+
+def measure(queryset) -> tuple:
+    """Evaluate ids of the queryset, returning them with the best time of a few runs."""
+    timings = []
+
+    for _ in range(3):
+        started = perf_counter()
+        ids = get_ids(queryset)
+        timings.append(perf_counter() - started)
+
+    return ids, min(timings)
+
+
+@pytest.mark.django_db
+def test_filter_category_matches_join_filter(brand: Brand) -> None:
+    """Subtree range filter matches the former join filter, and also covers levels deeper than three."""
+    levels = seed_catalog(brand, (2, 2, 2, 2), products=90)
+    root, child = Category.objects.get(pk=levels[0][0].pk), levels[1][0]
+
+    assert get_ids(Product.objects.filter_category(child.slug.upper())) == get_ids(
+        filter_category_by_joins(child.slug)
+    )
+
+    deepest = get_ids(Product.objects.filter(category__in=root.get_descendants().filter(level=3)))
+    ids = get_ids(Product.objects.filter_category(root.slug))
+
+    assert deepest
+    assert ids == get_ids(filter_category_by_joins(root.slug)) | deepest
+
+
+@pytest.mark.skipif(not BENCHMARK_PRODUCTS, reason="Set BENCHMARK_PRODUCTS to run the benchmark")
+@pytest.mark.django_db
+def test_filter_category_benchmark(brand: Brand) -> None:
+    """Subtree range filter is not slower than the former join filter on a catalog of 500 categories."""
+    levels = seed_catalog(brand, (10, 7, 6), products=BENCHMARK_PRODUCTS)
+    slug = levels[0][0].slug
+
+    ids, elapsed = measure(Product.objects.filter_category(slug))
+    expected_ids, expected_elapsed = measure(filter_category_by_joins(slug))
+
+    assert ids == expected_ids
+    assert elapsed <= expected_elapsed * 1.5, f"range filter took {elapsed:.4f}s, joins took {expected_elapsed:.4f}s"
+
+
+@pytest.mark.django_db
+def test_filter_category_unknown_slug() -> None:
+    assert not Product.objects.filter_category("missing").exists()
+
+
+@pytest.mark.django_db
+def test_suggest_matches_normalized_query(create_product) -> None:
+    product = create_product(code="AB-12", name_az="Şampun", name_ru="Шампунь")
+    create_product(1, name_az="Sabun", name_ru="Мыло")
+
+    assert list(Product.objects.suggest("ŞAMPUN")) == [product]
+    assert list(Product.objects.suggest("ab12")) == [product]
+    assert not Product.objects.suggest("!!").exists()
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from server.apps.product.models import Product
+from server.apps.task.logic.constants import TaskStatus
+from server.apps.task.logic.worker import Worker
+from server.apps.task.models import Task
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_expires_discounts_once_a_day(create_product) -> None:
+    """Starting worker expires the ended discounts of today and schedules the run of tomorrow."""
+    yesterday = timezone.localdate() - timedelta(days=1)
+    product = create_product(discount=20, discount_end_date=yesterday)
+    Product.objects.filter(pk=product.pk).update(effective_discount=20, final_price=8)
+
+    Worker(concurrency=1).run(once=True)
+
+    product.refresh_from_db()
+    assert (product.effective_discount, product.final_price) == (0, product.price)
+
+    tomorrow = timezone.localdate() + timedelta(days=1)
+    tasks = Task.objects.filter(key__startswith="product:expire-discounts:")
+
+    assert dict(tasks.values_list("key", "status")) == {
+        f"product:expire-discounts:{timezone.localdate()}": TaskStatus.SUCCEEDED,
+        f"product:expire-discounts:{tomorrow}": TaskStatus.PENDING,
+    }
+
+    Worker(concurrency=1).run(once=True)
+
+    assert tasks.count() == 2
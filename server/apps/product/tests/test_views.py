@@ -0,0 +1,39 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from server.apps.account.models import Favorite
+from server.apps.user.models import User
+
+
+@pytest.mark.django_db
+def test_product_list_favorite_flags_use_fixed_number_of_queries(
+    api_client: APIClient, user: User, create_product
+) -> None:
+    """Favorite flags of the listed products are resolved with one query, whatever the page size."""
+    products = [create_product(index) for index in range(30)]
+    Favorite.objects.bulk_create([Favorite(user=user, product=product) for product in products[::2]])
+
+    api_client.force_authenticate(user)
+
+    with CaptureQueriesContext(connection) as small_page:
+        response = api_client.get("/api/v1/products/", {"limit": 5})
+
+    assert response.status_code == 200
+
+    # Drop the cached favorite ids, so both requests load them from the database
+    cache.clear()
+
+    with CaptureQueriesContext(connection) as large_page:
+        response = api_client.get("/api/v1/products/", {"limit": 30})
+
+    assert response.status_code == 200
+    assert len(large_page.captured_queries) == len(small_page.captured_queries)
+
+    favorite_queries = [query for query in large_page.captured_queries if "account_favorite" in query["sql"]]
+    assert len(favorite_queries) == 1
+
+    favorite_slugs = {product.slug for product in products[::2]}
+    assert {item["slug"] for item in response.data["results"] if item["is_favorite"]} == favorite_slugs
@@ -1,18 +1,31 @@
-from drf_spectacular.utils import extend_schema
+from django.core.cache import cache
+from drf_spectacular.utils import extend_schema, OpenApiParameter
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
 from server.apps.core.logic import responses
+from server.apps.core.logic.caching import get_response_key
+from server.apps.core.logic.mixins import CachedResponseMixin, StreamingListMixin
+from server.apps.product.logic.facets import get_product_facets
 from server.apps.product.logic.filters import ProductFilter
-from server.apps.product.logic.serializers import ProductNoteSerializer, ProductSerializer
+from server.apps.product.logic.serializers import (
+    ProductFacetsSerializer,
+    ProductNoteSerializer,
+    ProductSerializer,
+    ProductSuggestSerializer,
+)
 from server.apps.product.models import Product, ProductNote
 
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(CachedResponseMixin, StreamingListMixin, viewsets.ModelViewSet):
     """Viewset for Product model."""
 
     queryset = Product.objects.none()
     serializer_class = ProductSerializer
 
+    cache_models = ("product.Product", "product.ProductImage", "brand.Brand", "category.Category")
+
     filterset_class = ProductFilter
     ordering_fields = "__all__"
 
@@ -23,10 +36,72 @@ class ProductViewSet(viewsets.ModelViewSet):
 
     lookup_field = "slug"
 
+    suggest_limit = 10
+
     def get_queryset(self):
         """Get the queryset for ProductViewSet."""
         return Product.objects.get_related()
 
+    @extend_schema(
+        description=f"Retrieve autocomplete suggestions of {verbose_name_plural} by name or code.",
+        responses={
+            status.HTTP_200_OK: ProductSuggestSerializer(many=True),
+        },
+        parameters=[
+            OpenApiParameter(name="q", required=True, type=str, location=OpenApiParameter.QUERY),
+        ],
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        serializer_class=ProductSuggestSerializer,
+        pagination_class=None,
+        filter_backends=[],
+    )
+    def suggest(self, request, *args, **kwargs):
+        """Retrieve autocomplete suggestions of products by name or code."""
+        return self.get_cached_response(self.get_suggestions, request, *args, **kwargs)
+
+    def get_suggestions(self, request, *args, **kwargs):
+        """Get the suggested products for the ``q`` query param."""
+        query = request.query_params.get("q", "").strip()
+
+        if not query:
+            return Response([])
+
+        products = (
+            Product.objects.suggest(query)
+            .with_thumbnail()
+            .only("slug", "code", "name_az", "name_ru")[: self.suggest_limit]
+        )
+
+        return Response(self.get_serializer(products, many=True).data)
+
+    @extend_schema(
+        description=f"Retrieve brand, category and price facet counts of {verbose_name_plural} matching the filters.",
+        responses={
+            status.HTTP_200_OK: ProductFacetsSerializer,
+        },
+        filters=True,
+    )
+    @action(detail=False, methods=["get"], serializer_class=ProductFacetsSerializer, pagination_class=None)
+    def facets(self, request, *args, **kwargs):
+        """
+        Retrieve brand, category and price facet counts of products matching the filters.
+
+        Facets do not depend on the user, so they are cached for everyone by the normalized filter params.
+        """
+        key = get_response_key(request, self.cache_models, only=self.filterset_class.base_filters)
+        data = cache.get(key)
+
+        if data is None:
+            queryset = self.filter_queryset(Product.objects.all())
+            data = self.get_serializer(get_product_facets(queryset)).data
+
+            cache.set(key, data, timeout=self.cache_timeout)
+
+        return Response(data)
+
     @extend_schema(
         description=f"Retrieve list of all {verbose_name_plural}.",
         responses={
@@ -0,0 +1,48 @@
+from django.contrib import admin
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from server.apps.core.admin import ModelAdmin
+from server.apps.task.logic.constants import TaskStatus
+from server.apps.task.models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(ModelAdmin):
+    """Task admin."""
+
+    list_display = ("name", "status", "attempts", "run_at", "finished_at")
+    list_filter = ("status", "name")
+    search_fields = ("name", "last_error")
+
+    readonly_fields = (
+        "name",
+        "args",
+        "kwargs",
+        "status",
+        "attempts",
+        "max_attempts",
+        "last_error",
+        "run_at",
+        "started_at",
+        "finished_at",
+    )
+
+    actions = ("retry",)
+
+    @admin.action(description=_("Retry selected tasks"))
+    def retry(self, request, queryset):
+        """Return the failed tasks to the queue with a fresh set of attempts."""
+        count = queryset.filter(status=TaskStatus.FAILED).update(
+            status=TaskStatus.PENDING, attempts=0, run_at=timezone.now(), finished_at=None
+        )
+
+        self.message_user(request, _("%(count)d task(s) were queued again.") % {"count": count})
+
+    def has_add_permission(self, request):
+        """Disable add permission."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Disable change permission."""
+        return False
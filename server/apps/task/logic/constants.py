@@ -0,0 +1,10 @@
+from django.db import models
+
+
+class TaskStatus(models.IntegerChoices):
+    """Choices for TaskStatus."""
+
+    PENDING = 0, "Gözləmədə"
+    RUNNING = 1, "İcra olunur"
+    SUCCEEDED = 2, "Tamamlanıb"
+    FAILED = 3, "Uğursuz olub"
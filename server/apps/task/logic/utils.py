@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.utils import timezone
+
+from server.apps.task.models import Task
+
+
+def enqueue(
+    name: str, args: tuple = (), kwargs: dict = None, key: str = None, run_at=None, max_attempts: int = None
+) -> Task:
+    """
+    Enqueue the task by the dotted path of its function.
+
+    The task is stored in the database, so it is committed or rolled back together with the surrounding transaction.
+    A task with the same idempotency ``key`` is enqueued only once. Arguments must be JSON serializable.
+    """
+    defaults = {
+        "name": name,
+        "args": list(args),
+        "kwargs": kwargs or {},
+        "run_at": run_at or timezone.now(),
+        "max_attempts": max_attempts or settings.TASK_MAX_ATTEMPTS,
+    }
+
+    if key is None:
+        return Task.objects.create(**defaults)
+
+    return Task.objects.get_or_create(key=key, defaults=defaults)[0]
+
+
+def task(func=None, *, max_attempts: int = None):
+    """
+    Register the function as a background task.
+
+    The function gets a ``delay`` method, which enqueues a call of it to be run by the worker,
+    and an ``apply_async`` method, which also accepts an idempotency key and the time to run at.
+    """
+
+    def decorator(func):
+        name = f"{func.__module__}.{func.__name__}"
+
+        def apply_async(args: tuple = (), kwargs: dict = None, key: str = None, run_at=None) -> Task:
+            return enqueue(name, args, kwargs, key=key, run_at=run_at, max_attempts=max_attempts)
+
+        def delay(*args, **kwargs) -> Task:
+            return apply_async(args, kwargs)
+
+        func.apply_async = apply_async
+        func.delay = delay
+
+        return func
+
+    return decorator if func is None else decorator(func)
@@ -0,0 +1,158 @@
+import logging
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from server.apps.task.logic.constants import TaskStatus
+from server.apps.task.models import Task
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    """
+    Run the pending tasks in a thread pool.
+
+    Tasks are claimed in batches with ``SELECT ... FOR UPDATE SKIP LOCKED``, so several workers can run side by side.
+    Failed tasks are retried with exponential backoff until they run out of attempts.
+    """
+
+    def __init__(self, concurrency: int = None, poll_interval: float = None):
+        self.concurrency = concurrency or settings.TASK_WORKER_CONCURRENCY
+        self.poll_interval = poll_interval or settings.TASK_POLL_INTERVAL
+        self.stopped = False
+
+    def stop(self, *args):
+        """Stop the worker after the running tasks are finished."""
+        self.stopped = True
+
+    def run(self, once: bool = False):
+        """Run the tasks until stopped, or until there are no pending tasks left if ``once`` is set."""
+        self.schedule_periodic_tasks()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="task") as executor:
+            while not self.stopped:
+                self.release_stale_tasks()
+
+                tasks = self.claim_tasks()
+
+                if tasks:
+                    list(executor.map(self.execute_in_thread, tasks))
+                elif once:
+                    break
+                else:
+                    time.sleep(self.poll_interval)
+
+    def schedule_periodic_tasks(self):
+        """Enqueue the periodic tasks by calling the configured schedulers."""
+        for path in settings.TASK_SCHEDULERS:
+            import_string(path)()
+
+    def release_stale_tasks(self) -> int:
+        """
+        Return the tasks left running by a stopped worker to the queue.
+
+        Tasks which have run out of attempts are marked failed, so a task killing or hanging
+        its worker every time is not retried forever. Return number of the tasks returned to the queue.
+        """
+        now = timezone.now()
+        tasks = Task.objects.filter(
+            status=TaskStatus.RUNNING, started_at__lt=now - timedelta(seconds=settings.TASK_STALE_TIMEOUT)
+        )
+
+        tasks.filter(attempts__gte=F("max_attempts")).update(
+            status=TaskStatus.FAILED, finished_at=now, last_error="Abandoned by a stopped worker."
+        )
+
+        return tasks.update(status=TaskStatus.PENDING)
+
+    def claim_tasks(self, queryset=None) -> list:
+        """Lock a batch of the due tasks, skipping the ones locked by other workers, and mark them running."""
+        queryset = Task.objects.all() if queryset is None else queryset
+        now = timezone.now()
+
+        with transaction.atomic():
+            tasks = list(
+                queryset.select_for_update(skip_locked=True)
+                .filter(status=TaskStatus.PENDING, run_at__lte=now)
+                .order_by("run_at")[: self.concurrency]
+            )
+
+            Task.objects.filter(pk__in=[task.pk for task in tasks]).update(
+                status=TaskStatus.RUNNING, started_at=now, attempts=F("attempts") + 1
+            )
+
+        for task in tasks:
+            task.attempts += 1
+
+        return tasks
+
+    def execute_in_thread(self, task: Task):
+        """Run the task in a thread of the pool, closing the database connection of the thread afterwards."""
+        try:
+            self.execute(task)
+        finally:
+            connections.close_all()
+
+    def execute(self, task: Task) -> bool:
+        """Run the task and store its result. Return True if it succeeded."""
+        try:
+            import_string(task.name)(*task.args, **task.kwargs)
+        except Exception:
+            self.fail(task, traceback.format_exc())
+            return False
+
+        Task.objects.filter(pk=task.pk).update(status=TaskStatus.SUCCEEDED, finished_at=timezone.now())
+
+        return True
+
+    def fail(self, task: Task, error: str):
+        """Schedule retry of the failed task with exponential backoff, or mark it failed if it has no attempts left."""
+        logger.error("Task #%s %s failed on attempt %s:\n%s", task.pk, task.name, task.attempts, error)
+
+        if task.attempts < task.max_attempts:
+            delay = settings.TASK_RETRY_DELAY * 2 ** (task.attempts - 1)
+
+            Task.objects.filter(pk=task.pk).update(
+                status=TaskStatus.PENDING, run_at=timezone.now() + timedelta(seconds=delay), last_error=error
+            )
+        else:
+            Task.objects.filter(pk=task.pk).update(
+                status=TaskStatus.FAILED, finished_at=timezone.now(), last_error=error
+            )
+
+
+def run_now(task: Task) -> bool:
+    """
+    Run the enqueued task in the current process, unless a worker has already claimed it.
+
+    Return True if it succeeded. Otherwise the task stays in the queue to be retried by the worker.
+    """
+    worker = Worker(concurrency=1)
+    tasks = worker.claim_tasks(Task.objects.filter(pk=task.pk))
+
+    return bool(tasks) and worker.execute(tasks[0])
+
+
+def wait_for(task: Task, timeout: float, interval: float = 0.2) -> bool:
+    """
+    Wait until a worker finishes running the task, for at most ``timeout`` seconds.
+
+    Return True if the task has succeeded. A task waiting in the queue for its retry is not waited for.
+    """
+    deadline = time.monotonic() + timeout
+
+    while True:
+        status = Task.objects.filter(pk=task.pk).values_list("status", flat=True).first()
+
+        if status != TaskStatus.RUNNING or time.monotonic() >= deadline:
+            return status == TaskStatus.SUCCEEDED
+
+        time.sleep(interval)
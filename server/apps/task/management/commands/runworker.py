@@ -0,0 +1,28 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from server.apps.task.logic.worker import Worker
+
+
+class Command(BaseCommand):
+    """Run the background task worker."""
+
+    help = "Run the background task worker."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, help="Number of tasks run in parallel.")
+        parser.add_argument("--poll-interval", type=float, help="Seconds to wait when there are no pending tasks.")
+        parser.add_argument("--once", action="store_true", help="Exit when there are no pending tasks left.")
+
+    def handle(self, *args, **options):
+        worker = Worker(concurrency=options["concurrency"], poll_interval=options["poll_interval"])
+
+        signal.signal(signal.SIGINT, worker.stop)
+        signal.signal(signal.SIGTERM, worker.stop)
+
+        self.stdout.write(self.style.SUCCESS(f"Starting worker with concurrency of {worker.concurrency}."))
+
+        worker.run(once=options["once"])
+
+        self.stdout.write(self.style.SUCCESS("Worker stopped."))
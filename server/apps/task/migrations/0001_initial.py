@@ -0,0 +1,47 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Task",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="Updated at")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Created at")),
+                ("name", models.CharField(max_length=255, verbose_name="Name")),
+                ("args", models.JSONField(blank=True, default=list, verbose_name="Arguments")),
+                ("kwargs", models.JSONField(blank=True, default=dict, verbose_name="Keyword Arguments")),
+                (
+                    "status",
+                    models.PositiveSmallIntegerField(
+                        choices=[(0, "Gözləmədə"), (1, "İcra olunur"), (2, "Tamamlanıb"), (3, "Uğursuz olub")],
+                        default=0,
+                        verbose_name="Status",
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0, verbose_name="Attempts")),
+                ("max_attempts", models.PositiveSmallIntegerField(default=5, verbose_name="Max Attempts")),
+                ("last_error", models.TextField(blank=True, verbose_name="Last Error")),
+                ("run_at", models.DateTimeField(default=django.utils.timezone.now, verbose_name="Run at")),
+                ("started_at", models.DateTimeField(blank=True, null=True, verbose_name="Started at")),
+                ("finished_at", models.DateTimeField(blank=True, null=True, verbose_name="Finished at")),
+            ],
+            options={
+                "verbose_name": "Task",
+                "verbose_name_plural": "Tasks",
+                "ordering": ("-created_at",),
+                "indexes": [
+                    models.Index(condition=models.Q(("status", 0)), fields=["run_at"], name="task_pending_run_at_idx")
+                ],
+            },
+        ),
+    ]
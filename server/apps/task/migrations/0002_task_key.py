@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-18 12:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="key",
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True, verbose_name="Idempotency Key"),
+        ),
+    ]
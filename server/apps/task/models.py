@@ -0,0 +1,44 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from server.apps.core.models import TimeStampedModel
+from server.apps.task.logic.constants import TaskStatus
+
+
+class Task(TimeStampedModel):
+    """Model definition for Task, a background job run by the ``runworker`` command."""
+
+    name = models.CharField(verbose_name=_("Name"), max_length=255)
+    args = models.JSONField(verbose_name=_("Arguments"), default=list, blank=True)
+    kwargs = models.JSONField(verbose_name=_("Keyword Arguments"), default=dict, blank=True)
+
+    key = models.CharField(verbose_name=_("Idempotency Key"), max_length=255, unique=True, null=True, blank=True)
+
+    status = models.PositiveSmallIntegerField(
+        verbose_name=_("Status"), choices=TaskStatus.choices, default=TaskStatus.PENDING
+    )
+
+    attempts = models.PositiveSmallIntegerField(verbose_name=_("Attempts"), default=0)
+    max_attempts = models.PositiveSmallIntegerField(verbose_name=_("Max Attempts"), default=5)
+    last_error = models.TextField(verbose_name=_("Last Error"), blank=True)
+
+    run_at = models.DateTimeField(verbose_name=_("Run at"), default=timezone.now)
+    started_at = models.DateTimeField(verbose_name=_("Started at"), null=True, blank=True)
+    finished_at = models.DateTimeField(verbose_name=_("Finished at"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("Task")
+        verbose_name_plural = _("Tasks")
+
+        ordering = ("-created_at",)
+
+        indexes = (
+            models.Index(
+                fields=("run_at",), condition=models.Q(status=TaskStatus.PENDING), name="task_pending_run_at_idx"
+            ),
+        )
+
+    def __str__(self):
+        """Unicode representation of Task."""
+        return f'{_("Task")} #{self.id} - {self.name}'
@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+import pytest
+from django.conf import settings
+from django.utils import timezone
+
+from server.apps.task.logic.constants import TaskStatus
+from server.apps.task.logic.worker import Worker
+from server.apps.task.models import Task
+
+
+@pytest.mark.django_db
+def test_stale_tasks_are_retried_until_out_of_attempts() -> None:
+    """Tasks abandoned by a stopped worker go back to the queue, or fail once they have no attempts left."""
+    started_at = timezone.now() - timedelta(seconds=settings.TASK_STALE_TIMEOUT + 1)
+    retried, failed = Task.objects.bulk_create(
+        [
+            Task(name="tasks.retried", status=TaskStatus.RUNNING, started_at=started_at, attempts=1, max_attempts=3),
+            Task(name="tasks.failed", status=TaskStatus.RUNNING, started_at=started_at, attempts=3, max_attempts=3),
+        ]
+    )
+
+    assert Worker().release_stale_tasks() == 1
+
+    retried.refresh_from_db()
+    failed.refresh_from_db()
+    assert retried.status == TaskStatus.PENDING
+    assert (failed.status, failed.last_error) == (TaskStatus.FAILED, "Abandoned by a stopped worker.")
+    assert failed.finished_at is not None
@@ -2,9 +2,13 @@ import tempfile
 
 import pytest
 from django.conf import LazySettings
+from django.core.cache import caches
 from PIL import Image
 from rest_framework.test import APIClient
 
+from server.apps.brand.models import Brand
+from server.apps.category.models import Category
+from server.apps.product.models import Product
 from server.apps.user.models import User
 
 
@@ -17,6 +21,13 @@ def _media_root(
     settings.MEDIA_ROOT = tmpdir_factory.mktemp("media", numbered=True)
 
 
+@pytest.fixture(autouse=True)
+def _clear_caches() -> None:
+    """Starts every test with empty caches."""
+    for cache in caches.all():
+        cache.clear()
+
+
 @pytest.fixture
 def temporary_image() -> tempfile.NamedTemporaryFile:
     """Returns path to temporary image."""
@@ -48,3 +59,34 @@ def user_data() -> dict:
 def user(user_data: dict) -> User:
     user_data.pop("password_confirm")
     return User.objects.create_user(**user_data)
+
+
+@pytest.fixture
+def brand() -> Brand:
+    return Brand.objects.create(name_az="Brend", name_ru="Бренд")
+
+
+@pytest.fixture
+def category() -> Category:
+    return Category.objects.create(name_az="Kateqoriya", name_ru="Категория")
+
+
+@pytest.fixture
+def create_product(brand: Brand, category: Category):
+    """Returns factory of products in the brand and category, with the given fields overridden."""
+
+    def factory(index: int = 0, **fields) -> Product:
+        fields = {
+            "code": f"P{index}",
+            "name_az": f"Məhsul {index}",
+            "name_ru": f"Товар {index}",
+            "description": "Description",
+            "brand": brand,
+            "category": category,
+            "price": 10,
+            "quantity": 10,
+            **fields,
+        }
+        return Product.objects.create(**fields)
+
+    return factory
@@ -19,12 +19,14 @@ ENV = config("DJANGO_ENV", default="local") or "local"
 base_settings = (
     "components/common.py",  # Standard Django Settings.
     "components/database.py",  # Database configuration.
+    "components/caches.py",  # Cache configuration.
     "components/logging.py",  # Logging configuration.
     "components/healthcheck.py",  # Health checks.
     "components/cors.py",  # CORS configuration.
     "components/restframework.py",  # Django REST Framework.
     "components/i18n.py",  # Internationalization.
     "components/mailer.py",  # Mail settings.
+    "components/tasks.py",  # Background tasks.
     "components/admin.py",  # Django Admin settings.
     "components/custom.py",  # Custom Project Settings.
     f"environments/{ENV}.py",  # Environment settings.
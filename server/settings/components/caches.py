@@ -0,0 +1,25 @@
+# Caches
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+from server.settings.components import BASE_DIR, config
+
+# File based caches are shared by all the gunicorn workers and the task worker,
+# so the version counters used for invalidation stay consistent between them.
+# The counters are kept apart from the culled response cache: evicting a counter
+# would bring stale responses back.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": config("CACHE_LOCATION", default=str(BASE_DIR / "cache")),
+        "TIMEOUT": config("CACHE_TIMEOUT", cast=int, default=60 * 60),
+        "OPTIONS": {
+            "MAX_ENTRIES": config("CACHE_MAX_ENTRIES", cast=int, default=10000),
+        },
+    },
+    # Holds a counter per cached model only, so it never grows near its entry limit.
+    "versions": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": config("CACHE_VERSIONS_LOCATION", default=str(BASE_DIR / "cache" / "versions")),
+        "TIMEOUT": None,
+    },
+}
@@ -22,6 +22,7 @@ INSTALLED_APPS += [
     "server.apps.banner",
     "server.apps.notification",
     "server.apps.promo",
+    "server.apps.task",
 ]
 
 # Modeltranslation
@@ -30,6 +31,7 @@ INSTALLED_APPS += [
 MODELTRANSLATION_TRANSLATION_FILES = [
     "server.apps.brand.logic.translation",
     "server.apps.category.logic.translation",
+    "server.apps.order.logic.translation",
     "server.apps.product.logic.translation",
 ]
 
@@ -31,6 +31,12 @@ else:
         }
     }
 
+# PostgreSQL specific features (full-text search, trigram lookups)
+# https://docs.djangoproject.com/en/5.0/ref/contrib/postgres/
+
+if USE_POSTGRES:
+    INSTALLED_APPS += ["django.contrib.postgres"]
+
 # django-cleanup
 # https://github.com/un1t/django-cleanup
 
@@ -0,0 +1,26 @@
+# Background tasks
+# Stored in the database and run by the ``runworker`` management command.
+
+from server.settings.components import config
+
+# Number of tasks run in parallel by a worker
+TASK_WORKER_CONCURRENCY = config("TASK_WORKER_CONCURRENCY", cast=int, default=4)
+
+# Seconds to wait for new tasks when the queue is empty
+TASK_POLL_INTERVAL = config("TASK_POLL_INTERVAL", cast=float, default=1.0)
+
+# Attempts of a task before it is marked as failed
+TASK_MAX_ATTEMPTS = config("TASK_MAX_ATTEMPTS", cast=int, default=5)
+
+# Seconds to wait before the first retry, doubled on every following one
+TASK_RETRY_DELAY = config("TASK_RETRY_DELAY", cast=int, default=10)
+
+# Seconds after which a running task is considered abandoned by a stopped worker
+TASK_STALE_TIMEOUT = config("TASK_STALE_TIMEOUT", cast=int, default=60 * 10)
+
+# Functions enqueueing the periodic tasks, called when a worker starts.
+# The scheduled tasks enqueue their next runs themselves.
+TASK_SCHEDULERS = (
+    "server.apps.order.tasks.schedule_reconcile_payments",
+    "server.apps.product.tasks.schedule_expire_discounts",
+)
@@ -11,3 +11,13 @@ ALLOWED_HOSTS = []
 INSTALLED_APPS += [
     "server.apps.core.tests",
 ]
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "versions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "versions",
+    },
+}